@@ -1,5 +1,4 @@
 from src.models.base import SessionLocal
-from src.models.signals import Signal
 from src.models.positions import Position
 from src.core.allocator import Allocator
 from src.core.round_manager import RoundManager
@@ -15,13 +14,14 @@ broker = PaperBroker(starting_cash=Decimal(100000))
 broker.connect()
 order_manager = OrderManager(db, broker)
 
-signals = db.query(Signal).filter(Signal.status == 'ACTIVE').all()
+signals = allocator.load_actionable_signals(db)
 print(f'Found {len(signals)} signals')
 
-decisions = allocator.allocate_capital(
+# Deployed capital is summed from open positions in SQL
+decisions = allocator.allocate_capital_from_db(
     signals=signals,
     current_portfolio_value=Decimal(100000),
-    open_positions=[],
+    db=db,
     allocation_power=1.0
 )
 
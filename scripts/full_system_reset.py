@@ -8,217 +8,232 @@ import sys
 import os
 sys.path.append('/app')
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from datetime import datetime, timedelta
-from config.settings import get_settings
+from src.models.base import create_script_engine
 
-def reset_all_data():
-    """Reset all trading data and initialize fresh trial."""
+def _reset(conn, out):
+    """Clear all trading data and initialize a fresh trial on an open connection."""
+    out.append("🔄 Starting full system reset...")
+    
+    # Start transaction
+    trans = conn.begin()
+    
     try:
-        settings = get_settings()
-        engine = create_engine(settings.DATABASE_URL)
+        # 1. Clear all position data
+        out.append("📊 Clearing position history...")
+        conn.execute(text("DELETE FROM positions"))
+        conn.execute(text("DELETE FROM scenario_positions"))
+        conn.execute(text("DELETE FROM scenario_trades"))
         
-        print("🔄 Starting full system reset...")
+        # 2. Clear order history
+        out.append("📋 Clearing order history...")
+        conn.execute(text("DELETE FROM orders"))
+        
+        # 3. Clear audit logs
+        out.append("📝 Clearing audit logs...")
+        conn.execute(text("DELETE FROM audit_log"))
+        
+        # 4. Clear cycle data
+        out.append("🔄 Clearing cycle data...")
+        conn.execute(text("DELETE FROM cycle_states"))
+        conn.execute(text("DELETE FROM cycles"))
+        
+        # 5. Reset scenario performance data
+        out.append("🎯 Resetting scenario performance...")
+        conn.execute(text("""
+            UPDATE scenarios SET 
+                current_capital = 100000.0,
+                total_pnl = 0.0,
+                total_return_pct = 0.0,
+                total_trades = 0,
+                winning_trades = 0,
+                losing_trades = 0,
+                win_rate = 0.0,
+                max_drawdown = 0.0,
+                sharpe_ratio = 0.0,
+                last_updated = NOW()
+            WHERE is_active = true
+        """))
+        
+        # 6. Clear philosophy state
+        out.append("🧠 Resetting philosophy state...")
+        conn.execute(text("DELETE FROM philosophy_state"))
+        
+        # 7. Reset signal persistence
+        out.append("📡 Resetting signal persistence...")
+        conn.execute(text("UPDATE signals SET persisted_cycles = 0"))
+        
+        # 8. Create fresh cycle
+        out.append("🚀 Creating fresh 30-day cycle...")
+        cycle_start = datetime.utcnow()
+        cycle_end = cycle_start + timedelta(days=30)
+        cycle_id = f"cycle_{cycle_start.strftime('%Y%m%d_%H%M%S')}"
+        
+        conn.execute(text("""
+            INSERT INTO cycles (
+                cycle_id, 
+                start_date, 
+                end_date, 
+                status, 
+                max_positions,
+                target_position_size,
+                max_position_size,
+                min_position_size,
+                total_invested,
+                total_return,
+                total_pnl,
+                positions_opened,
+                positions_closed,
+                signals_analyzed
+            ) VALUES (
+                :cycle_id,
+                :start_date,
+                :end_date,
+                'ACTIVE',
+                10,
+                0.03,
+                0.05,
+                0.01,
+                0.0,
+                0.0,
+                0.0,
+                0,
+                0,
+                0
+            )
+        """), {
+            'cycle_id': cycle_id,
+            'start_date': cycle_start,
+            'end_date': cycle_end
+        })
+        
+        # 9. Initialize fresh philosophy state
+        out.append("⚙️ Initializing philosophy state...")
+        today = datetime.utcnow().date()
+        conn.execute(text("""
+            INSERT INTO philosophy_state (
+                date,
+                decisions_logged,
+                intuition_overrides,
+                trades_with_safety,
+                trades_without_safety,
+                cluster_signals_detected,
+                cluster_positions_taken,
+                positions_retired,
+                avg_return_per_cycle,
+                positions_extended,
+                avg_sharpe_at_extension,
+                rule_violations,
+                violated_rules,
+                current_allocation_power
+            ) VALUES (
+                :date,
+                0,
+                0,
+                0.0,
+                0.0,
+                0,
+                0,
+                0,
+                0.0,
+                0,
+                0.0,
+                0,
+                '{}',
+                1.0
+            )
+        """), {
+            'date': today
+        })
+        
+        # Commit all changes
+        trans.commit()
+        
+        out.append("✅ Full system reset completed successfully!")
+        out.append(f"📅 New 30-day cycle started: {cycle_start.strftime('%Y-%m-%d %H:%M:%S')} UTC")
+        out.append(f"📅 Cycle ends: {cycle_end.strftime('%Y-%m-%d %H:%M:%S')} UTC")
+        out.append("💰 All scenarios reset to $100,000 starting capital")
+        out.append("🎯 Ready for fresh 30-day trial!")
+        
+        return True
         
-        with engine.connect() as conn:
-            # Start transaction
-            trans = conn.begin()
-            
-            try:
-                # 1. Clear all position data
-                print("📊 Clearing position history...")
-                conn.execute(text("DELETE FROM positions"))
-                conn.execute(text("DELETE FROM scenario_positions"))
-                conn.execute(text("DELETE FROM scenario_trades"))
-                
-                # 2. Clear order history
-                print("📋 Clearing order history...")
-                conn.execute(text("DELETE FROM orders"))
-                
-                # 3. Clear audit logs
-                print("📝 Clearing audit logs...")
-                conn.execute(text("DELETE FROM audit_log"))
-                
-                # 4. Clear cycle data
-                print("🔄 Clearing cycle data...")
-                conn.execute(text("DELETE FROM cycle_states"))
-                conn.execute(text("DELETE FROM cycles"))
-                
-                # 5. Reset scenario performance data
-                print("🎯 Resetting scenario performance...")
-                conn.execute(text("""
-                    UPDATE scenarios SET 
-                        current_capital = 100000.0,
-                        total_pnl = 0.0,
-                        total_return_pct = 0.0,
-                        total_trades = 0,
-                        winning_trades = 0,
-                        losing_trades = 0,
-                        win_rate = 0.0,
-                        max_drawdown = 0.0,
-                        sharpe_ratio = 0.0,
-                        last_updated = NOW()
-                    WHERE is_active = true
-                """))
-                
-                # 6. Clear philosophy state
-                print("🧠 Resetting philosophy state...")
-                conn.execute(text("DELETE FROM philosophy_state"))
-                
-                # 7. Reset signal persistence
-                print("📡 Resetting signal persistence...")
-                conn.execute(text("UPDATE signals SET persisted_cycles = 0"))
-                
-                # 8. Create fresh cycle
-                print("🚀 Creating fresh 30-day cycle...")
-                cycle_start = datetime.utcnow()
-                cycle_end = cycle_start + timedelta(days=30)
-                cycle_id = f"cycle_{cycle_start.strftime('%Y%m%d_%H%M%S')}"
-                
-                conn.execute(text("""
-                    INSERT INTO cycles (
-                        cycle_id, 
-                        start_date, 
-                        end_date, 
-                        status, 
-                        max_positions,
-                        target_position_size,
-                        max_position_size,
-                        min_position_size,
-                        total_invested,
-                        total_return,
-                        total_pnl,
-                        positions_opened,
-                        positions_closed,
-                        signals_analyzed
-                    ) VALUES (
-                        :cycle_id,
-                        :start_date,
-                        :end_date,
-                        'ACTIVE',
-                        10,
-                        0.03,
-                        0.05,
-                        0.01,
-                        0.0,
-                        0.0,
-                        0.0,
-                        0,
-                        0,
-                        0
-                    )
-                """), {
-                    'cycle_id': cycle_id,
-                    'start_date': cycle_start,
-                    'end_date': cycle_end
-                })
-                
-                # 9. Initialize fresh philosophy state
-                print("⚙️ Initializing philosophy state...")
-                today = datetime.utcnow().date()
-                conn.execute(text("""
-                    INSERT INTO philosophy_state (
-                        date,
-                        decisions_logged,
-                        intuition_overrides,
-                        trades_with_safety,
-                        trades_without_safety,
-                        cluster_signals_detected,
-                        cluster_positions_taken,
-                        positions_retired,
-                        avg_return_per_cycle,
-                        positions_extended,
-                        avg_sharpe_at_extension,
-                        rule_violations,
-                        violated_rules,
-                        current_allocation_power
-                    ) VALUES (
-                        :date,
-                        0,
-                        0,
-                        0.0,
-                        0.0,
-                        0,
-                        0,
-                        0,
-                        0.0,
-                        0,
-                        0.0,
-                        0,
-                        '{}',
-                        1.0
-                    )
-                """), {
-                    'date': today
-                })
-                
-                # Commit all changes
-                trans.commit()
-                
-                print("✅ Full system reset completed successfully!")
-                print(f"📅 New 30-day cycle started: {cycle_start.strftime('%Y-%m-%d %H:%M:%S')} UTC")
-                print(f"📅 Cycle ends: {cycle_end.strftime('%Y-%m-%d %H:%M:%S')} UTC")
-                print("💰 All scenarios reset to $100,000 starting capital")
-                print("🎯 Ready for fresh 30-day trial!")
-                
-                return True
-                
-            except Exception as e:
-                trans.rollback()
-                print(f"❌ Error during reset: {e}")
-                return False
-                
     except Exception as e:
-        print(f"❌ Failed to connect to database: {e}")
+        trans.rollback()
+        out.append(f"❌ Error during reset: {e}")
         return False
 
-def verify_reset():
-    """Verify that the reset was successful."""
+def _verify(conn, out):
+    """Verify that the reset was successful, reusing the reset's connection."""
     try:
-        settings = get_settings()
-        engine = create_engine(settings.DATABASE_URL)
+        # Check position counts
+        positions = conn.execute(text("SELECT COUNT(*) FROM positions")).scalar()
+        scenario_positions = conn.execute(text("SELECT COUNT(*) FROM scenario_positions")).scalar()
+        orders = conn.execute(text("SELECT COUNT(*) FROM orders")).scalar()
+        
+        # Check scenario capital
+        scenarios = conn.execute(text("""
+            SELECT scenario_name, current_capital, total_pnl 
+            FROM scenarios 
+            WHERE is_active = true
+        """)).fetchall()
+        
+        # Check active cycle
+        active_cycle = conn.execute(text("""
+            SELECT cycle_id, start_date, end_date, status 
+            FROM cycle_states 
+            WHERE status = 'ACTIVE'
+        """)).fetchone()
+        
+        out.append("\n🔍 Reset Verification:")
+        out.append(f"📊 Positions: {positions} (should be 0)")
+        out.append(f"📊 Scenario Positions: {scenario_positions} (should be 0)")
+        out.append(f"📋 Orders: {orders} (should be 0)")
+        
+        out.append(f"\n🎯 Scenario Status:")
+        for scenario in scenarios:
+            out.append(f"  {scenario[0]}: ${scenario[1]:,.0f} capital, ${scenario[2]:,.0f} P&L")
+        
+        if active_cycle:
+            out.append(f"\n🔄 Active Cycle: {active_cycle[0]}")
+            out.append(f"   Start: {active_cycle[1]}")
+            out.append(f"   End: {active_cycle[2]}")
+            out.append(f"   Status: {active_cycle[3]}")
+        
+        return positions == 0 and scenario_positions == 0 and orders == 0
         
-        with engine.connect() as conn:
-            # Check position counts
-            positions = conn.execute(text("SELECT COUNT(*) FROM positions")).scalar()
-            scenario_positions = conn.execute(text("SELECT COUNT(*) FROM scenario_positions")).scalar()
-            orders = conn.execute(text("SELECT COUNT(*) FROM orders")).scalar()
-            
-            # Check scenario capital
-            scenarios = conn.execute(text("""
-                SELECT scenario_name, current_capital, total_pnl 
-                FROM scenarios 
-                WHERE is_active = true
-            """)).fetchall()
-            
-            # Check active cycle
-            active_cycle = conn.execute(text("""
-                SELECT cycle_id, start_date, end_date, status 
-                FROM cycle_states 
-                WHERE status = 'ACTIVE'
-            """)).fetchone()
-            
-            print("\n🔍 Reset Verification:")
-            print(f"📊 Positions: {positions} (should be 0)")
-            print(f"📊 Scenario Positions: {scenario_positions} (should be 0)")
-            print(f"📋 Orders: {orders} (should be 0)")
-            
-            print(f"\n🎯 Scenario Status:")
-            for scenario in scenarios:
-                print(f"  {scenario[0]}: ${scenario[1]:,.0f} capital, ${scenario[2]:,.0f} P&L")
-            
-            if active_cycle:
-                print(f"\n🔄 Active Cycle: {active_cycle[0]}")
-                print(f"   Start: {active_cycle[1]}")
-                print(f"   End: {active_cycle[2]}")
-                print(f"   Status: {active_cycle[3]}")
-            
-            return positions == 0 and scenario_positions == 0 and orders == 0
-            
     except Exception as e:
-        print(f"❌ Verification failed: {e}")
+        out.append(f"❌ Verification failed: {e}")
         return False
 
+def reset_all_data():
+    """
+    Reset all trading data, initialize a fresh trial and verify the result.
+    Reset and verification share a single connection.
+    
+    Returns:
+        Dict with 'success' and 'verified' flags
+    """
+    # Progress lines are collected and written once at the end
+    out = []
+    result = {'success': False, 'verified': False}
+    try:
+        engine = create_script_engine()
+        
+        with engine.connect() as conn:
+            result['success'] = _reset(conn, out)
+            if result['success']:
+                result['verified'] = _verify(conn, out)
+        
+    except Exception as e:
+        out.append(f"❌ Failed to connect to database: {e}")
+    
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
+    
+    return result
+
 if __name__ == "__main__":
     print("🥋 Dojo Allocator - Full System Reset")
     print("=" * 50)
@@ -230,14 +245,12 @@ if __name__ == "__main__":
     print("🔄 A new 30-day cycle will be created.")
     print()
     
-    # Perform reset
-    success = reset_all_data()
+    # Perform reset and verify
+    result = reset_all_data()
+    success = result['success']
     
     if success:
-        # Verify reset
-        verified = verify_reset()
-        
-        if verified:
+        if result['verified']:
             print("\n🎉 Reset completed and verified successfully!")
             print("🚀 System is ready for the 30-day trial!")
             print("\nNext steps:")
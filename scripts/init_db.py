@@ -2,15 +2,16 @@
 Database initialization script.
 Creates all tables and converts them to TimescaleDB hypertables.
 """
-from sqlalchemy import create_engine, text
-from src.models.base import Base
+from sqlalchemy import text
+from src.models.base import Base, create_script_engine
 # CRITICAL: Import all models to register them
 from src.models.signals import Signal
 from src.models.positions import Position
 from src.models.orders import Order
 from src.models.audit_log import AuditLog
 from src.models.philosophy_state import PhilosophyState
-from config.settings import get_settings
+from src.models.cycles import Cycle
+from src.models.scenarios import Scenario, ScenarioPosition, ScenarioTrade
 
 def init_database():
     """
@@ -18,11 +19,10 @@ def init_database():
     Steps:
     1. Create TimescaleDB extension
     2. Create all tables from SQLAlchemy models
-    3. Convert time-series tables to hypertables (skip if error)
-    4. Create indexes
+    3. Create indexes (including ones added after the tables were created)
+    4. Verify tables
     """
-    settings = get_settings()
-    engine = create_engine(settings.DATABASE_URL)
+    engine = create_script_engine()
 
     print("🥋 Dojo Allocator - Database Initialization")
     print("=" * 50)
@@ -46,8 +46,18 @@ def init_database():
         print(f"  ✗ Error creating tables: {e}")
         return
 
-    # Step 3: Verify
-    print("\n3. Verifying tables...")
+    # Step 3: Create indexes missing from tables that already existed
+    print("\n3. Creating indexes...")
+    try:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=engine, checkfirst=True)
+        print("  ✓ Indexes created")
+    except Exception as e:
+        print(f"  ⚠ Warning: {e}")
+
+    # Step 4: Verify
+    print("\n4. Verifying tables...")
     try:
         with engine.connect() as conn:
             result = conn.execute(text("""
@@ -9,6 +9,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from datetime import datetime, timedelta
 from decimal import Decimal
+from sqlalchemy import delete
 from src.models.base import SessionLocal
 from src.models.signals import Signal
 from src.models.positions import Position
@@ -154,8 +155,16 @@ def test_tier_escalation_confirmation():
         # Cleanup
         print("\n5. Cleaning up test data...")
         try:
-            db.query(Position).filter(Position.position_id == 'POS_TIER_TEST_001').delete()
-            db.query(Signal).filter(Signal.signal_id.like('TEST_TIER_%')).delete()
+            db.execute(
+                delete(Position)
+                .where(Position.position_id == 'POS_TIER_TEST_001')
+                .execution_options(synchronize_session=False)
+            )
+            db.execute(
+                delete(Signal)
+                .where(Signal.signal_id.like('TEST_TIER_%'))
+                .execution_options(synchronize_session=False)
+            )
             db.commit()
             print("   ✓ Cleanup complete")
         except Exception as e:
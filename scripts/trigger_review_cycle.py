@@ -2,28 +2,41 @@
 """
 Manually trigger the tier escalation review cycle.
 Useful for testing and immediate execution.
+
+Usage:
+    python scripts/trigger_review_cycle.py [count]
+
+Pass a count to run several cycles back to back in one session, e.g. 2 to
+get past the escalation persistence threshold in a single invocation.
 """
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.models.base import SessionLocal
+from src.models.base import SessionLocal, create_script_engine
 from src.core.review_cycle_manager import ReviewCycleManager
 
-def trigger_review_cycle():
-    """Manually execute a tier escalation review cycle."""
+def trigger_review_cycle(count: int = 1):
+    """Manually execute one or more tier escalation review cycles."""
     print("🥋 Manually Triggering Tier Escalation Review Cycle")
     print("=" * 60)
     
-    db = SessionLocal()
+    db = SessionLocal(bind=create_script_engine())
     
     try:
-        print("\nRunning review cycle...")
         manager = ReviewCycleManager(db)
-        result = manager.execute_review_cycle()
+        results = []
+        for i in range(count):
+            print(f"\nRunning review cycle {i + 1}/{count}...")
+            results.append(manager.execute_review_cycle())
+        result = results[-1]
         
         print(f"\n✓ Review cycle completed!")
-        print(f"\nResults:")
+        if count > 1:
+            total_executed = sum(r.get('executed_escalations', 0) for r in results)
+            print(f"  - Cycles run: {count}")
+            print(f"  - Escalations executed (all cycles): {total_executed}")
+        print(f"\nResults (last cycle):")
         print(f"  - Review timestamp: {result.get('review_timestamp')}")
         print(f"  - Potential escalations found: {result.get('potential_escalations', 0)}")
         print(f"  - Escalations executed: {result.get('executed_escalations', 0)}")
@@ -53,6 +66,13 @@ def trigger_review_cycle():
         db.close()
 
 if __name__ == "__main__":
-    success = trigger_review_cycle()
+    try:
+        count = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    except ValueError:
+        count = 0
+    if count < 1:
+        print("Usage: python scripts/trigger_review_cycle.py [count]  (count must be a positive integer)")
+        sys.exit(2)
+    success = trigger_review_cycle(count)
     sys.exit(0 if success else 1)
 
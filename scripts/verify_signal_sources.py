@@ -6,16 +6,23 @@ This script verifies which signal sources are currently working and
 provides detailed analysis of the signal pipeline.
 
 Usage:
-    python scripts/verify_signal_sources.py
+    python scripts/verify_signal_sources.py [--db-only]
+
+Pass --db-only to skip the network fetcher tests and only analyze the
+signals already in the database.
 """
 
+import argparse
+import io
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from datetime import datetime, timedelta
-from sqlalchemy import func
-from src.models.base import SessionLocal
+from sqlalchemy import DateTime, bindparam, func, select, text
+from src.models.base import engine
 from src.models.signals import Signal
 from src.data.stock_act import StockActFetcher
 from src.data.openinsider import OpenInsiderFetcher
@@ -24,262 +31,329 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-def test_stock_act_fetcher():
+def test_stock_act_fetcher(out=None):
     """Test STOCK Act congressional trades fetcher."""
-    print("=" * 60)
-    print("TESTING STOCK ACT FETCHER")
-    print("=" * 60)
+    print("=" * 60, file=out)
+    print("TESTING STOCK ACT FETCHER", file=out)
+    print("=" * 60, file=out)
     
     try:
         fetcher = StockActFetcher()
         trades = fetcher.fetch_recent_trades()
         signals = fetcher.transform_to_signal_format(trades)
         
-        print(f"✅ Fetched {len(trades)} congressional trades")
-        print(f"✅ Transformed into {len(signals)} signals")
+        print(f"✅ Fetched {len(trades)} congressional trades", file=out)
+        print(f"✅ Transformed into {len(signals)} signals", file=out)
         
         if signals:
             sample = signals[0]
-            print(f"\nSample signal:")
-            print(f"  Symbol: {sample['symbol']}")
-            print(f"  Direction: {sample['direction']}")
-            print(f"  Filer: {sample['filer_name']}")
-            print(f"  Value: ${sample['transaction_value']:,.2f}")
-            print(f"  Source: {sample['source']}")
+            print(f"\nSample signal:", file=out)
+            print(f"  Symbol: {sample['symbol']}", file=out)
+            print(f"  Direction: {sample['direction']}", file=out)
+            print(f"  Filer: {sample['filer_name']}", file=out)
+            print(f"  Value: ${sample['transaction_value']:,.2f}", file=out)
+            print(f"  Source: {sample['source']}", file=out)
         
         return len(signals)
         
     except Exception as e:
-        print(f"❌ STOCK Act fetcher failed: {e}")
+        print(f"❌ STOCK Act fetcher failed: {e}", file=out)
         return 0
 
-def test_openinsider_fetcher():
-    """Test OpenInsider congressional trades fetcher."""
-    print("\n" + "=" * 60)
-    print("TESTING OPENINSIDER FETCHER")
-    print("=" * 60)
+def test_openinsider_fetcher(out=None, fetcher=None, insider_buys=None):
+    """
+    Test OpenInsider congressional trades fetcher. insider_buys is an
+    optional future for an already-requested fetch_recent_buys(limit=50).
+    """
+    print("\n" + "=" * 60, file=out)
+    print("TESTING OPENINSIDER FETCHER", file=out)
+    print("=" * 60, file=out)
     
     try:
-        fetcher = OpenInsiderFetcher()
+        fetcher = fetcher or OpenInsiderFetcher()
+        
+        # Both screener pages are independent requests; fetch them together
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            congress_future = pool.submit(fetcher.fetch_congressional_trades, limit=50)
+            insider_future = insider_buys or pool.submit(fetcher.fetch_recent_buys, limit=50)
         
         # Test congressional trades
-        congress_trades = fetcher.fetch_congressional_trades(limit=50)
+        congress_trades = congress_future.result()
         congress_signals = fetcher.transform_to_signal_format(congress_trades)
         
-        print(f"✅ Congressional: {len(congress_trades)} trades → {len(congress_signals)} signals")
+        print(f"✅ Congressional: {len(congress_trades)} trades → {len(congress_signals)} signals", file=out)
         
         # Test insider purchases
-        insider_trades = fetcher.fetch_recent_buys(limit=50)
+        insider_trades = insider_future.result()
         insider_signals = fetcher.transform_to_signal_format(insider_trades)
         
-        print(f"✅ Insider buys: {len(insider_trades)} trades → {len(insider_signals)} signals")
+        print(f"✅ Insider buys: {len(insider_trades)} trades → {len(insider_signals)} signals", file=out)
         
         total_signals = len(congress_signals) + len(insider_signals)
         
         if congress_signals:
             sample = congress_signals[0]
-            print(f"\nSample congressional signal:")
-            print(f"  Symbol: {sample['symbol']}")
-            print(f"  Filer: {sample['filer_name']}")
-            print(f"  Value: ${sample['transaction_value']:,.0f}")
-            print(f"  Source: {sample['source']}")
+            print(f"\nSample congressional signal:", file=out)
+            print(f"  Symbol: {sample['symbol']}", file=out)
+            print(f"  Filer: {sample['filer_name']}", file=out)
+            print(f"  Value: ${sample['transaction_value']:,.0f}", file=out)
+            print(f"  Source: {sample['source']}", file=out)
         
         if insider_signals:
             sample = insider_signals[0]
-            print(f"\nSample insider signal:")
-            print(f"  Symbol: {sample['symbol']}")
-            print(f"  Filer: {sample['filer_name']}")
-            print(f"  Value: ${sample['transaction_value']:,.0f}")
-            print(f"  Source: {sample['source']}")
+            print(f"\nSample insider signal:", file=out)
+            print(f"  Symbol: {sample['symbol']}", file=out)
+            print(f"  Filer: {sample['filer_name']}", file=out)
+            print(f"  Value: ${sample['transaction_value']:,.0f}", file=out)
+            print(f"  Source: {sample['source']}", file=out)
         
         return total_signals
         
     except Exception as e:
-        print(f"❌ OpenInsider fetcher failed: {e}")
+        print(f"❌ OpenInsider fetcher failed: {e}", file=out)
         return 0
 
-def test_sec_edgar_fetcher():
-    """Test SEC EDGAR fetcher."""
-    print("\n" + "=" * 60)
-    print("TESTING SEC EDGAR FETCHER")
-    print("=" * 60)
+def test_sec_edgar_fetcher(out=None, insider_buys=None):
+    """
+    Test SEC EDGAR fetcher. insider_buys is an optional future for
+    OpenInsider purchases to build Form 4 filings from instead of fetching.
+    """
+    print("\n" + "=" * 60, file=out)
+    print("TESTING SEC EDGAR FETCHER", file=out)
+    print("=" * 60, file=out)
     
     try:
         fetcher = SECEdgarFetcher()
         
+        # Form 4 and 13F lookups are independent; issue them together
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            form4_future = pool.submit(
+                lambda: fetcher.fetch_recent_form4(
+                    limit=10,
+                    insider_trades=insider_buys.result() if insider_buys else None
+                )
+            )
+            form13f_future = pool.submit(fetcher.fetch_recent_13f, limit=10)
+        
         # Test Form 4 fetching
-        form4_filings = fetcher.fetch_recent_form4(limit=10)
-        print(f"✅ Form 4: {len(form4_filings)} filings")
+        form4_filings = form4_future.result()
+        print(f"✅ Form 4: {len(form4_filings)} filings", file=out)
         
         # Test 13F fetching
-        form13f_filings = fetcher.fetch_recent_13f(limit=10)
-        print(f"✅ 13F: {len(form13f_filings)} filings")
+        form13f_filings = form13f_future.result()
+        print(f"✅ 13F: {len(form13f_filings)} filings", file=out)
         
         total_signals = len(form4_filings) + len(form13f_filings)
         
         if form4_filings:
             sample = form4_filings[0]
-            print(f"\nSample Form 4:")
-            print(f"  Data: {sample}")
+            print(f"\nSample Form 4:", file=out)
+            print(f"  Data: {sample}", file=out)
         
         return total_signals
         
     except Exception as e:
-        print(f"❌ SEC EDGAR fetcher failed: {e}")
+        print(f"❌ SEC EDGAR fetcher failed: {e}", file=out)
         return 0
 
+# Every count breakdown in the report, from one scan of signals. The
+# 7-day bound is a typed bind so it is sent as a timestamp parameter.
+_SIGNAL_COUNTS_SQL = text("""
+    SELECT source, status, conviction_tier,
+           COUNT(*) AS total,
+           COUNT(*) FILTER (WHERE filing_date >= :week_ago) AS recent
+    FROM signals
+    GROUP BY source, status, conviction_tier
+""").bindparams(bindparam('week_ago', type_=DateTime))
+
 def analyze_database_signals():
     """Analyze signals currently in the database."""
-    print("\n" + "=" * 60)
-    print("DATABASE SIGNAL ANALYSIS")
-    print("=" * 60)
+    # Report lines are written to stdout in one go at the end
+    lines = []
+    lines.append("\n" + "=" * 60)
+    lines.append("DATABASE SIGNAL ANALYSIS")
+    lines.append("=" * 60)
     
-    db = SessionLocal()
+    # One pooled connection (and one implicit transaction) for every query
+    conn = engine.connect()
     
     try:
-        # 1. Count by source
-        print("\n1. Signals by source (all time):")
-        by_source = db.query(
-            Signal.source,
-            func.count(Signal.id)
-        ).group_by(Signal.source).all()
+        # The grouped counts are a small working set; the per-source,
+        # recent, status and ACTIVE tier breakdowns are all folded from it
+        week_ago = datetime.utcnow() - timedelta(days=7)
+        counts = conn.execute(_SIGNAL_COUNTS_SQL, {'week_ago': week_ago}).all()
+        
+        by_source = {}
+        recent_by_source = {}
+        by_status = {}
+        by_tier = {}
+        for source, status, tier, count, recent in counts:
+            by_source[source] = by_source.get(source, 0) + count
+            recent_by_source[source] = recent_by_source.get(source, 0) + recent
+            by_status[status] = by_status.get(status, 0) + count
+            if status == 'ACTIVE':
+                by_tier[tier] = by_tier.get(tier, 0) + count
         
-        total_signals = 0
-        for source, count in by_source:
-            print(f"   {source:20}: {count:6} signals")
-            total_signals += count
+        # 1. Count by source
+        lines.append("\n1. Signals by source (all time):")
+        lines.extend(f"   {source:20}: {count:6} signals" for source, count in by_source.items())
+        total_signals = sum(by_source.values())
         
-        print(f"   {'TOTAL':20}: {total_signals:6} signals")
+        lines.append(f"   {'TOTAL':20}: {total_signals:6} signals")
         
         # 2. Recent signals (past 7 days)
-        print("\n2. Recent signals (past 7 days):")
-        week_ago = datetime.utcnow() - timedelta(days=7)
-        recent = db.query(
-            Signal.source,
-            func.count(Signal.id)
-        ).filter(
-            Signal.filing_date >= week_ago
-        ).group_by(Signal.source).all()
+        lines.append("\n2. Recent signals (past 7 days):")
+        lines.extend(f"   {source:20}: {count:6} signals" for source, count in recent_by_source.items() if count)
+        recent_total = sum(recent_by_source.values())
         
-        recent_total = 0
-        for source, count in recent:
-            print(f"   {source:20}: {count:6} signals")
-            recent_total += count
-        
-        print(f"   {'TOTAL':20}: {recent_total:6} signals")
+        lines.append(f"   {'TOTAL':20}: {recent_total:6} signals")
         
         # 3. Status breakdown
-        print("\n3. Signal status:")
-        by_status = db.query(
-            Signal.status,
-            func.count(Signal.id)
-        ).group_by(Signal.status).all()
-        
-        for status, count in by_status:
-            print(f"   {status:15}: {count:6} signals")
+        lines.append("\n3. Signal status:")
+        lines.extend(f"   {status:15}: {count:6} signals" for status, count in by_status.items())
         
         # 4. Sample recent signals
-        print("\n4. Most recent 10 signals:")
-        samples = db.query(Signal).order_by(
+        lines.append("\n4. Most recent 10 signals:")
+        # Index-only scan over idx_signals_recent_cover; dates and amounts
+        # come back pre-formatted so no Python datetimes/Decimals are built
+        samples = conn.execute(select(
+            Signal.source,
+            Signal.symbol,
+            func.coalesce(func.substr(Signal.filer_name, 1, 30), ''),
+            func.coalesce(func.to_char(Signal.filing_date, 'YYYY-MM-DD'), 'N/A'),
+            func.coalesce(
+                func.to_char(func.nullif(Signal.transaction_value, 0), 'FM"$"999,999,999,990'),
+                'N/A'
+            )
+        ).order_by(
             Signal.filing_date.desc()
-        ).limit(10).all()
+        ).limit(10)).all()
         
-        for sig in samples:
-            filing_date = sig.filing_date.strftime('%Y-%m-%d') if sig.filing_date else 'N/A'
-            value = f"${sig.transaction_value:,.0f}" if sig.transaction_value else 'N/A'
-            print(f"   {sig.source:15} {sig.symbol:6} {sig.filer_name[:30]:30} {filing_date} {value}")
+        lines.extend(
+            f"   {source:15} {symbol:6} {filer_name:30} {filing_date} {value}"
+            for source, symbol, filer_name, filing_date, value in samples
+        )
         
         # 5. Conviction tier breakdown
-        print("\n5. Conviction tier breakdown:")
-        by_tier = db.query(
-            Signal.conviction_tier,
-            func.count(Signal.id)
-        ).filter(
-            Signal.status == 'ACTIVE'
-        ).group_by(Signal.conviction_tier).all()
-        
-        for tier, count in by_tier:
-            print(f"   {tier or 'NULL':15}: {count:6} signals")
+        lines.append("\n5. Conviction tier breakdown:")
+        lines.extend(f"   {tier or 'NULL':15}: {count:6} signals" for tier, count in by_tier.items())
         
         # 6. Top symbols by signal count
-        print("\n6. Top symbols by signal count:")
-        top_symbols = db.query(
-            Signal.symbol,
-            func.count(Signal.id)
-        ).filter(
-            Signal.status == 'ACTIVE'
-        ).group_by(Signal.symbol).order_by(
-            func.count(Signal.id).desc()
-        ).limit(10).all()
-        
-        for symbol, count in top_symbols:
-            print(f"   {symbol:10}: {count:3} signals")
+        lines.append("\n6. Top symbols by signal count:")
+        # Served by the idx_signals_active_symbol partial index
+        top_symbols = conn.execute(text("""
+            SELECT symbol, COUNT(*) AS c
+            FROM signals
+            WHERE status = 'ACTIVE'
+            GROUP BY symbol
+            ORDER BY c DESC
+            LIMIT 10
+        """)).all()
+        
+        lines.extend(f"   {symbol:10}: {count:3} signals" for symbol, count in top_symbols)
         
         return {
             'total_signals': total_signals,
             'recent_signals': recent_total,
-            'active_signals': db.query(Signal).filter(Signal.status == 'ACTIVE').count(),
+            'active_signals': by_status.get('ACTIVE', 0),
             'sources': len(by_source)
         }
         
     finally:
-        db.close()
+        conn.close()
+        sys.stdout.write("\n".join(lines) + "\n")
+
+def _run_buffered(test_fn):
+    """
+    Run a fetcher test with its report captured in a buffer, so tests
+    running in parallel threads don't interleave their output.
+    """
+    buf = io.StringIO()
+    count = test_fn(out=buf)
+    return count, buf.getvalue()
 
 def main():
     """Main verification function."""
-    print("🔍 SIGNAL SOURCE VERIFICATION")
-    print("=" * 60)
-    print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    parser = argparse.ArgumentParser(description="Verify signal sources")
+    parser.add_argument('--db-only', action='store_true',
+                        help="skip the fetcher tests and only analyze the database")
+    args = parser.parse_args()
     
-    # Test each fetcher
-    stock_act_signals = test_stock_act_fetcher()
-    openinsider_signals = test_openinsider_fetcher()
-    sec_edgar_signals = test_sec_edgar_fetcher()
+    sys.stdout.write(
+        "🔍 SIGNAL SOURCE VERIFICATION\n"
+        + "=" * 60 + "\n"
+        + f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+    )
+    
+    if not args.db_only:
+        # Test each fetcher; they are network-bound and independent, so run them
+        # concurrently and print each buffered report once all have finished.
+        # The OpenInsider and SEC Form 4 tests share one latest-purchases fetch.
+        openinsider = OpenInsiderFetcher()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            insider_buys = pool.submit(openinsider.fetch_recent_buys, limit=50)
+            fetcher_tests = (
+                test_stock_act_fetcher,
+                partial(test_openinsider_fetcher, fetcher=openinsider, insider_buys=insider_buys),
+                partial(test_sec_edgar_fetcher, insider_buys=insider_buys),
+            )
+            results = list(pool.map(_run_buffered, fetcher_tests))
+        sys.stdout.write("".join(report for _, report in results))
+        stock_act_signals, openinsider_signals, sec_edgar_signals = (count for count, _ in results)
     
     # Analyze database
     db_stats = analyze_database_signals()
     
     # Summary
-    print("\n" + "=" * 60)
-    print("VERIFICATION SUMMARY")
-    print("=" * 60)
+    lines = []
+    lines.append("\n" + "=" * 60)
+    lines.append("VERIFICATION SUMMARY")
+    lines.append("=" * 60)
     
-    print(f"\n📊 FETCHER TEST RESULTS:")
-    print(f"   STOCK Act:      {stock_act_signals:3} signals")
-    print(f"   OpenInsider:    {openinsider_signals:3} signals")
-    print(f"   SEC EDGAR:      {sec_edgar_signals:3} signals")
-    print(f"   Total fetched:  {stock_act_signals + openinsider_signals + sec_edgar_signals:3} signals")
+    if not args.db_only:
+        lines.append(f"\n📊 FETCHER TEST RESULTS:")
+        lines.append(f"   STOCK Act:      {stock_act_signals:3} signals")
+        lines.append(f"   OpenInsider:    {openinsider_signals:3} signals")
+        lines.append(f"   SEC EDGAR:      {sec_edgar_signals:3} signals")
+        lines.append(f"   Total fetched:  {stock_act_signals + openinsider_signals + sec_edgar_signals:3} signals")
     
-    print(f"\n💾 DATABASE STATISTICS:")
-    print(f"   Total signals:  {db_stats['total_signals']:3}")
-    print(f"   Recent (7d):    {db_stats['recent_signals']:3}")
-    print(f"   Active:         {db_stats['active_signals']:3}")
-    print(f"   Sources:        {db_stats['sources']:3}")
+    lines.append(f"\n💾 DATABASE STATISTICS:")
+    lines.append(f"   Total signals:  {db_stats['total_signals']:3}")
+    lines.append(f"   Recent (7d):    {db_stats['recent_signals']:3}")
+    lines.append(f"   Active:         {db_stats['active_signals']:3}")
+    lines.append(f"   Sources:        {db_stats['sources']:3}")
     
     # Recommendations
-    print(f"\n🎯 RECOMMENDATIONS:")
+    lines.append(f"\n🎯 RECOMMENDATIONS:")
     
     if db_stats['recent_signals'] < 50:
-        print("   ⚠️  LOW SIGNAL VOLUME: Need more recent signals for 90-day cycles")
-        print("   💡 Consider adding Form 4 insider trades (100s per day)")
-        print("   💡 Consider adding 13D activist filings (high quality)")
+        lines.append("   ⚠️  LOW SIGNAL VOLUME: Need more recent signals for 90-day cycles")
+        lines.append("   💡 Consider adding Form 4 insider trades (100s per day)")
+        lines.append("   💡 Consider adding 13D activist filings (high quality)")
     
-    if sec_edgar_signals == 0:
-        print("   ⚠️  SEC EDGAR NOT WORKING: Form 4 fetcher returns empty")
-        print("   💡 Implement actual SEC EDGAR parsing")
+    if not args.db_only and sec_edgar_signals == 0:
+        lines.append("   ⚠️  SEC EDGAR NOT WORKING: Form 4 fetcher returns empty")
+        lines.append("   💡 Implement actual SEC EDGAR parsing")
     
     if db_stats['sources'] < 3:
-        print("   ⚠️  LIMITED SOURCES: Only using congressional trades")
-        print("   💡 Add insider trading and activist investor sources")
+        lines.append("   ⚠️  LIMITED SOURCES: Only using congressional trades")
+        lines.append("   💡 Add insider trading and activist investor sources")
     
     if db_stats['active_signals'] < 20:
-        print("   ⚠️  LOW ACTIVE SIGNALS: May not hit 50 trades/cycle target")
-        print("   💡 Review signal scoring and quality filters")
+        lines.append("   ⚠️  LOW ACTIVE SIGNALS: May not hit 50 trades/cycle target")
+        lines.append("   💡 Review signal scoring and quality filters")
+    
+    # Targets are checked against counts the analysis already fetched
+    lines.append(f"\n✅ TARGET METRICS:")
+    targets = (
+        ("Recent signals (7d): 50+", db_stats['recent_signals'], 50),
+        ("Active signals:      50+", db_stats['active_signals'], 50),
+        ("Signal sources:      3+ ", db_stats['sources'], 3),
+    )
+    for label, value, target in targets:
+        lines.append(f"   {label} ✅" if value >= target else f"   {label} ❌ ({value})")
     
-    print(f"\n✅ TARGET METRICS:")
-    print(f"   Recent signals (7d): 50+ ✅" if db_stats['recent_signals'] >= 50 else f"   Recent signals (7d): 50+ ❌ ({db_stats['recent_signals']})")
-    print(f"   Active signals:      50+ ✅" if db_stats['active_signals'] >= 50 else f"   Active signals:      50+ ❌ ({db_stats['active_signals']})")
-    print(f"   Signal sources:      3+  ✅" if db_stats['sources'] >= 3 else f"   Signal sources:      3+  ❌ ({db_stats['sources']})")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == '__main__':
     main()
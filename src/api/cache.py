@@ -0,0 +1,151 @@
+"""
+Redis-backed response cache for slow-moving GET endpoints.
+"""
+import asyncio
+import functools
+import json
+from itertools import chain
+import redis
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from src.utils.logging import get_logger
+from src.utils.redis_client import get_cache_client
+
+logger = get_logger(__name__)
+
+CACHE_PREFIX = "dojo:cache:"
+DEFAULT_NAMESPACE = "api"
+# Position/signal/order listings and stats, cleared when those rows change
+STATS_NAMESPACE = "stats"
+
+# Model class -> cache namespace invalidated when rows of that model are committed
+_watched_models = {}
+
+def _cache_key(namespace: str, func, kwargs: dict) -> str:
+    # Only plain query/path params go into the key; Session, Request etc. are skipped
+    params = ",".join(
+        f"{name}={value}"
+        for name, value in sorted(kwargs.items())
+        if value is None or isinstance(value, (str, int, float, bool))
+    )
+    return f"{CACHE_PREFIX}{namespace}:{func.__name__}:{params}"
+
+def _is_error(response) -> bool:
+    return isinstance(response, dict) and (
+        response.get("status") == "error" or "error" in response
+    )
+
+def _get(key: str):
+    try:
+        body = get_cache_client().get(key)
+    except redis.RedisError as e:
+        logger.warning(f"Response cache read failed: {e}")
+        return None
+    # Hits are served as the stored JSON bytes, without re-serializing
+    return Response(content=body, media_type="application/json") if body is not None else None
+
+def _set(key: str, response, expire: int):
+    if isinstance(response, Response):
+        if response.status_code != 200:
+            return response
+        body = response.body
+    elif _is_error(response):
+        # Error payloads are returned as-is but never cached
+        return response
+    else:
+        body = json.dumps(jsonable_encoder(response)).encode()
+
+    try:
+        get_cache_client().set(key, body, ex=expire)
+    except redis.RedisError as e:
+        logger.warning(f"Response cache write failed: {e}")
+    return response
+
+def cached(expire: int, namespace: str = DEFAULT_NAMESPACE):
+    """
+    Cache an endpoint's response in Redis for `expire` seconds.
+    Keyed by function name and the endpoint's scalar parameters.
+    Falls through to the handler if Redis is down.
+    """
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key = _cache_key(namespace, func, kwargs)
+                hit = _get(key)
+                if hit is not None:
+                    return hit
+                return _set(key, await func(*args, **kwargs), expire)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _cache_key(namespace, func, kwargs)
+            hit = _get(key)
+            if hit is not None:
+                return hit
+            return _set(key, func(*args, **kwargs), expire)
+        return wrapper
+    return decorator
+
+def invalidate_cache(namespace: str = None):
+    """Drop cached responses in `namespace`, or every namespace if None."""
+    pattern = f"{CACHE_PREFIX}{namespace or '*'}:*"
+    try:
+        client = get_cache_client()
+        keys = list(client.scan_iter(match=pattern, count=500))
+        if keys:
+            client.delete(*keys)
+    except redis.RedisError as e:
+        logger.warning(f"Response cache invalidation failed: {e}")
+
+def invalidate_on_commit(namespace: str, *models):
+    """
+    Invalidate `namespace` after any session commit that inserted, updated
+    or deleted instances of `models`, including bulk Query.update/delete
+    statements. Applies to every Session in the process.
+    
+    Each matching commit runs a synchronous SCAN + DEL against Redis in the
+    committing thread, bounded by the client's 0.5s socket timeout.
+    """
+    if not _watched_models:
+        event.listen(Session, "after_flush", _track_writes)
+        event.listen(Session, "do_orm_execute", _track_bulk_writes)
+        event.listen(Session, "after_commit", _invalidate_tracked)
+        event.listen(Session, "after_rollback", _discard_tracked)
+    for model in models:
+        _watched_models[model] = namespace
+
+def register_stats_invalidation():
+    """
+    Clear cached position/signal/order listings and stats whenever a commit
+    changes those rows. Called once per process at API and worker startup.
+    """
+    from src.models.signals import Signal
+    from src.models.positions import Position
+    from src.models.orders import Order
+    invalidate_on_commit(STATS_NAMESPACE, Position, Signal, Order)
+
+def _track_writes(session, flush_context):
+    for obj in chain(session.new, session.dirty, session.deleted):
+        namespace = _watched_models.get(type(obj))
+        if namespace:
+            session.info.setdefault("dirty_cache_namespaces", set()).add(namespace)
+
+def _track_bulk_writes(orm_execute_state):
+    # Bulk UPDATE/DELETE bypasses the unit of work, so after_flush never sees it
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    namespace = _watched_models.get(mapper.class_) if mapper is not None else None
+    if namespace:
+        orm_execute_state.session.info.setdefault("dirty_cache_namespaces", set()).add(namespace)
+
+def _invalidate_tracked(session):
+    for namespace in session.info.pop("dirty_cache_namespaces", ()):
+        invalidate_cache(namespace)
+
+def _discard_tracked(session):
+    session.info.pop("dirty_cache_namespaces", None)
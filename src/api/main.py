@@ -1,18 +1,35 @@
 """
 FastAPI application entry point.
 """
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
 from src.api.routes import signals, positions, orders, health
+from src.models.base import get_db
+from src.api.cache import cached, invalidate_cache, register_stats_invalidation
+from src.api.responses import DojoORJSONResponse
+from src.utils.logging import get_logger
 import yaml
 import os
+import time
+import hashlib
 from pydantic import BaseModel
 from typing import Dict, Any
 
+# libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+logger = get_logger(__name__)
+
 app = FastAPI(
     title="Dojo Allocator API",
     description="Autonomous trading system API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=DojoORJSONResponse
 )
 
 # CORS middleware
@@ -24,26 +41,144 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# GET endpoints polled by clients and load balancers; answered with ETags
+_ETAG_PREFIXES = ("/orders", "/positions", "/signals", "/health")
+
+@app.middleware("http")
+async def etag_short_circuit(request: Request, call_next):
+    """
+    Tag successful polled GET responses with a body hash and answer a
+    matching If-None-Match with an empty 304.
+    """
+    response = await call_next(request)
+    if (
+        request.method != "GET"
+        or not request.url.path.startswith(_ETAG_PREFIXES)
+        or response.status_code != 200
+    ):
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=2"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    response_headers = dict(response.headers)
+    response_headers.update(headers)
+    return Response(
+        content=body,
+        status_code=response.status_code,
+        headers=response_headers,
+        media_type=response.media_type
+    )
+
+@app.on_event("startup")
+def configure_threadpool():
+    """Raise the worker thread limit; sync handlers (DB, backup/restore) all run there."""
+    from anyio import to_thread
+    to_thread.current_default_thread_limiter().total_tokens = 64
+
+@app.on_event("startup")
+def register_cache_invalidation():
+    """Drop cached stats when API-side commits change positions, signals or orders."""
+    register_stats_invalidation()
+
+@app.on_event("startup")
+def connect_broker():
+    """Connect one shared broker for the process instead of one per request."""
+    from src.execution.paper_broker import PaperBroker
+    app.state.broker = PaperBroker()
+    app.state.broker.connect()
+
+@app.on_event("shutdown")
+def disconnect_broker():
+    """Disconnect the shared broker."""
+    app.state.broker.disconnect()
+
 # Include routers
 app.include_router(health.router, tags=["Health"])
 app.include_router(signals.router, prefix="/signals", tags=["Signals"])
 app.include_router(positions.router, prefix="/positions", tags=["Positions"])
 app.include_router(orders.router, prefix="/orders", tags=["Orders"])
 
+# Default philosophy settings, serialized once at import so reset is a single write
+_DEFAULT_PHILOSOPHY: Dict[str, Any] = {
+    'dalio': {
+        'enabled': True,
+        'violation_penalty_pct': 0.1
+    },
+    'buffett': {
+        'enabled': True,
+        'minimum_expected_return': 0.15,
+        'violation_penalty_pct': 0.15
+    },
+    'pabrai': {
+        'enabled': True,
+        'cluster_threshold': 3,
+        'position_multiplier': 2.0,
+        'allocation_bonus_pct': 0.1
+    },
+    'oleary': {
+        'enabled': True,
+        'max_hold_days': 90,
+        'min_return_threshold': 0.05
+    },
+    'saylor': {
+        'enabled': True,
+        'sharpe_threshold': 2.0,
+        'extension_days': 30,
+        'min_tier': 'S'
+    },
+    'japanese_discipline': {
+        'enabled': True,
+        'rules': {
+            'fixed_round_duration_days': 90,
+            'violation_penalty_pct': 0.2,
+            'penalty_decay_rounds': 10
+        }
+    }
+}
+_DEFAULT_PHILOSOPHY_YAML = yaml.dump(
+    _DEFAULT_PHILOSOPHY, Dumper=SafeDumper, default_flow_style=False
+).encode()
+
+# Parsed philosophy.yaml keyed by path -> (st_mtime_ns, config)
+_PHILOSOPHY_CACHE: Dict[str, tuple] = {}
+
+def _load_philosophy_config(config_path: str) -> dict:
+    """Load philosophy.yaml, re-parsing only when the file's mtime changes."""
+    mtime = os.stat(config_path).st_mtime_ns
+    cached = _PHILOSOPHY_CACHE.get(config_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    with open(config_path, 'rb') as f:
+        config = yaml.load(f, Loader=SafeLoader)
+    _PHILOSOPHY_CACHE[config_path] = (mtime, config)
+    return config
+
 # Philosophy API endpoints
 @app.get("/philosophy/current")
-async def get_current_philosophy_settings():
+def get_current_philosophy_settings(request: Request):
     """Get current philosophy configuration"""
     try:
         config_path = os.path.join("config", "philosophy.yaml")
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        return config
+        
+        # The file's mtime identifies the version; unchanged polls get a bare 304
+        etag = f'W/"{os.stat(config_path).st_mtime_ns:x}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        
+        return DojoORJSONResponse(
+            _load_philosophy_config(config_path),
+            headers={"ETag": etag, "Cache-Control": "max-age=60"}
+        )
     except Exception as e:
         return {"error": f"Could not load philosophy settings: {str(e)}"}
 
 @app.post("/philosophy/update")
-async def update_philosophy_settings(settings: Dict[str, Any]):
+def update_philosophy_settings(settings: Dict[str, Any]):
     """Update philosophy configuration"""
     try:
         config_path = os.path.join("config", "philosophy.yaml")
@@ -56,7 +191,9 @@ async def update_philosophy_settings(settings: Dict[str, Any]):
         
         # Save to philosophy.yaml
         with open(config_path, 'w') as f:
-            yaml.dump(settings, f, default_flow_style=False)
+            yaml.dump(settings, f, Dumper=SafeDumper, default_flow_style=False)
+        _PHILOSOPHY_CACHE.pop(config_path, None)
+        invalidate_cache()
         
         return {"success": True, "message": "Settings updated successfully"}
         
@@ -64,90 +201,64 @@ async def update_philosophy_settings(settings: Dict[str, Any]):
         return {"error": f"Failed to update settings: {str(e)}"}
 
 @app.post("/philosophy/reset")
-async def reset_philosophy_settings():
+def reset_philosophy_settings():
     """Reset to default philosophy settings"""
     try:
         config_path = os.path.join("config", "philosophy.yaml")
         
-        # Default settings
-        default_settings = {
-            'dalio': {
-                'enabled': True,
-                'violation_penalty_pct': 0.1
-            },
-            'buffett': {
-                'enabled': True,
-                'minimum_expected_return': 0.15,
-                'violation_penalty_pct': 0.15
-            },
-            'pabrai': {
-                'enabled': True,
-                'cluster_threshold': 3,
-                'position_multiplier': 2.0,
-                'allocation_bonus_pct': 0.1
-            },
-            'oleary': {
-                'enabled': True,
-                'max_hold_days': 90,
-                'min_return_threshold': 0.05
-            },
-            'saylor': {
-                'enabled': True,
-                'sharpe_threshold': 2.0,
-                'extension_days': 30,
-                'min_tier': 'S'
-            },
-            'japanese_discipline': {
-                'enabled': True,
-                'rules': {
-                    'fixed_round_duration_days': 90,
-                    'violation_penalty_pct': 0.2,
-                    'penalty_decay_rounds': 10
-                }
-            }
-        }
-        
         # Save defaults
-        with open(config_path, 'w') as f:
-            yaml.dump(default_settings, f, default_flow_style=False)
+        with open(config_path, 'wb') as f:
+            f.write(_DEFAULT_PHILOSOPHY_YAML)
+        _PHILOSOPHY_CACHE.pop(config_path, None)
+        invalidate_cache()
         
         return {"success": True, "message": "Reset to defaults successfully"}
         
     except Exception as e:
         return {"error": f"Failed to reset settings: {str(e)}"}
 
+# Today's philosophy state response, held for a few seconds between dashboard polls
+_PHILOSOPHY_STATE_TTL = 10.0
+_philosophy_state_cache = {"key": None, "value": None, "expires": 0.0}
+
+def invalidate_philosophy_state_cache():
+    """Force the next /philosophy/state call to hit the database."""
+    _philosophy_state_cache["expires"] = 0.0
+
 @app.get("/philosophy/state")
-async def get_philosophy_state():
+def get_philosophy_state(db: Session = Depends(get_db)):
     """Get current allocation power and violation state"""
     try:
-        from src.models.base import SessionLocal
         from src.models.philosophy_state import PhilosophyState
         from datetime import date
         
-        db = SessionLocal()
-        try:
-            # Get today's philosophy state
-            state = db.query(PhilosophyState).filter(
-                PhilosophyState.date == date.today()
-            ).first()
-            
-            if not state:
-                return {
-                    "current_allocation_power": 1.0,
-                    "total_violations": 0,
-                    "clean_rounds": 0,
-                    "violations": []
-                }
-            
-            return {
+        now = time.monotonic()
+        today = date.today()
+        if _philosophy_state_cache["key"] == today and _philosophy_state_cache["expires"] > now:
+            return _philosophy_state_cache["value"]
+        
+        # Get today's philosophy state
+        state = db.query(PhilosophyState).filter(
+            PhilosophyState.date == today
+        ).first()
+        
+        if not state:
+            response = {
+                "current_allocation_power": 1.0,
+                "total_violations": 0,
+                "clean_rounds": 0,
+                "violations": []
+            }
+        else:
+            response = {
                 "current_allocation_power": float(state.current_allocation_power),
                 "total_violations": state.rule_violations,
                 "clean_rounds": getattr(state, 'clean_rounds_count', 0),
                 "violations": getattr(state, 'violation_history', [])
             }
-            
-        finally:
-            db.close()
+        
+        _philosophy_state_cache.update(key=today, value=response, expires=now + _PHILOSOPHY_STATE_TTL)
+        return response
             
     except Exception as e:
         return {
@@ -168,12 +279,12 @@ def root():
     }
 
 @app.post("/backup/create")
-async def create_backup():
+def create_backup():
     """Create comprehensive system backup (database + code files)"""
     import subprocess
     import os
-    import tarfile
     import shutil
+    import tempfile
     from datetime import datetime
     
     try:
@@ -182,46 +293,50 @@ async def create_backup():
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Step 1: Create database backup
-        db_backup_file = f"{backup_dir}/dojo_db_backup_{timestamp}.sql"
-        
-        db_result = subprocess.run(
-            ["pg_dump", "-h", "postgres", "-U", "dojo", "dojo_allocator"],
-            capture_output=True,
-            text=True,
-            env={"PGPASSWORD": "password"}
-        )
-        
-        if db_result.returncode != 0:
-            return {"status": "error", "message": f"Database backup failed: {db_result.stderr}"}
-        
-        with open(db_backup_file, "w") as f:
-            f.write(db_result.stdout)
-        
-        # Step 2: Create full system backup
-        system_backup_file = f"{backup_dir}/dojo_full_backup_{timestamp}.tar.gz"
-        
         # Get the project root directory
         project_root = "/app"  # Adjust this path based on your Docker setup
         
-        # Create tar.gz archive with all project files
-        with tarfile.open(system_backup_file, "w:gz") as tar:
-            # Add all source code files
-            tar.add(f"{project_root}/src", arcname="src")
-            tar.add(f"{project_root}/dashboard", arcname="dashboard")
-            tar.add(f"{project_root}/config", arcname="config")
-            tar.add(f"{project_root}/scripts", arcname="scripts")
+        # Staging dir holds the dump under database/ so tar can pick it up
+        staging_dir = tempfile.mkdtemp(prefix=".staging_", dir=backup_dir)
+        try:
+            # Step 1: Create database backup, written by pg_dump straight to disk
+            os.makedirs(f"{staging_dir}/database")
+            db_backup_file = f"{staging_dir}/database/dojo_db_backup_{timestamp}.sql"
             
-            # Add configuration files
-            for config_file in ["requirements.txt", "docker-compose.yml", "Dockerfile", ".env.example"]:
-                if os.path.exists(f"{project_root}/{config_file}"):
-                    tar.add(f"{project_root}/{config_file}", arcname=config_file)
+            with open(db_backup_file, "wb") as f:
+                db_result = subprocess.run(
+                    ["pg_dump", "-h", "postgres", "-U", "dojo", "dojo_allocator"],
+                    stdout=f,
+                    stderr=subprocess.PIPE,
+                    env={"PGPASSWORD": "password"}
+                )
             
-            # Add database backup to the archive
-            tar.add(db_backup_file, arcname=f"database/dojo_db_backup_{timestamp}.sql")
-        
-        # Clean up temporary database file
-        os.remove(db_backup_file)
+            if db_result.returncode != 0:
+                return {"status": "error", "message": f"Database backup failed: {db_result.stderr.decode(errors='replace')}"}
+            
+            # Step 2: Create full system backup.
+            # GNU tar + pigz archive and compress in parallel native code.
+            system_backup_file = f"{backup_dir}/dojo_full_backup_{timestamp}.tar.gz"
+            
+            config_files = [
+                config_file
+                for config_file in ["requirements.txt", "docker-compose.yml", "Dockerfile", ".env.example"]
+                if os.path.exists(f"{project_root}/{config_file}")
+            ]
+            
+            tar_result = subprocess.run(
+                [
+                    "tar", "--use-compress-program=pigz -6", "-cf", system_backup_file,
+                    "-C", project_root, "src", "dashboard", "config", "scripts", *config_files,
+                    "-C", staging_dir, "database"
+                ],
+                stderr=subprocess.PIPE
+            )
+            
+            if tar_result.returncode != 0:
+                return {"status": "error", "message": f"Archive creation failed: {tar_result.stderr.decode(errors='replace')}"}
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
         
         # Get file size for reporting
         file_size = os.path.getsize(system_backup_file)
@@ -238,35 +353,108 @@ async def create_backup():
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
-@app.get("/backup/list")
-async def list_backups():
-    """List available backups"""
-    import glob
+@app.get("/backup/download")
+def download_backup():
+    """Stream a full system backup straight to the client without keeping it on disk"""
+    import subprocess
     import os
+    import shutil
+    import tempfile
     from datetime import datetime
     
-    backup_dir = "/mnt/user-data/backups"
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    project_root = "/app"  # Adjust this path based on your Docker setup
+    
+    # The dump still has to be staged so tar can read it alongside the tree
+    staging_dir = tempfile.mkdtemp(prefix="dojo_backup_")
     try:
-        # Get both old database-only backups and new full system backups
-        db_files = glob.glob(f"{backup_dir}/dojo_backup_*.sql.gz")
-        system_files = glob.glob(f"{backup_dir}/dojo_full_backup_*.tar.gz")
-        all_files = db_files + system_files
-        all_files.sort(reverse=True)
-        
-        backups = []
-        for f in all_files:
-            stat = os.stat(f)
-            filename = os.path.basename(f)
+        os.makedirs(f"{staging_dir}/database")
+        with open(f"{staging_dir}/database/dojo_db_backup_{timestamp}.sql", "wb") as f:
+            db_result = subprocess.run(
+                ["pg_dump", "-h", "postgres", "-U", "dojo", "dojo_allocator"],
+                stdout=f,
+                stderr=subprocess.PIPE,
+                env={"PGPASSWORD": "password"}
+            )
+        
+        if db_result.returncode != 0:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            return {"status": "error", "message": f"Database backup failed: {db_result.stderr.decode(errors='replace')}"}
+        
+        config_files = [
+            config_file
+            for config_file in ["requirements.txt", "docker-compose.yml", "Dockerfile", ".env.example"]
+            if os.path.exists(f"{project_root}/{config_file}")
+        ]
+        
+        # stderr goes to a file so a chatty tar can't block on a full pipe
+        stderr_file = tempfile.TemporaryFile(dir=staging_dir)
+        proc = subprocess.Popen(
+            [
+                "tar", "--use-compress-program=pigz -6", "-cf", "-",
+                "-C", project_root, "src", "dashboard", "config", "scripts", *config_files,
+                "-C", staging_dir, "database"
+            ],
+            stdout=subprocess.PIPE,
+            stderr=stderr_file
+        )
+    except Exception as e:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        return {"status": "error", "message": str(e)}
+    
+    def iter_backup():
+        try:
+            while chunk := proc.stdout.read(1 << 20):
+                yield chunk
+            if proc.wait() != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode(errors="replace").strip()
+                logger.error(f"Backup archive failed with exit code {proc.returncode}: {stderr}")
+                # Raising mid-stream aborts the response, so the client sees a failed download
+                raise RuntimeError(f"Backup archive failed with exit code {proc.returncode}")
+        finally:
+            proc.stdout.close()
+            if proc.poll() is None:
+                # Client went away before the archive finished
+                proc.kill()
+            proc.wait()
+            stderr_file.close()
+            shutil.rmtree(staging_dir, ignore_errors=True)
+    
+    return StreamingResponse(
+        iter_backup(),
+        media_type="application/gzip",
+        headers={"Content-Disposition": f"attachment; filename=dojo_full_backup_{timestamp}.tar.gz"}
+    )
+
+# Backup listing keyed by the backup dir's mtime; adding or removing a file bumps it
+_backup_list_cache = {"mtime": None, "value": None}
+
+def _scan_backups(backup_dir: str) -> dict:
+    """Scan the backup directory once, reading stat info from the dir entries."""
+    from datetime import datetime
+    
+    entries = []
+    full_system_backups = 0
+    database_only_backups = 0
+    with os.scandir(backup_dir) as it:
+        for entry in it:
+            filename = entry.name
             
             # Determine backup type
-            if "dojo_full_backup_" in filename:
+            if filename.startswith("dojo_full_backup_") and filename.endswith(".tar.gz"):
+                full_system_backups += 1
                 backup_type = "Full System Backup"
                 description = "Database + Source Code + Config"
-            else:
+            elif filename.startswith("dojo_backup_") and filename.endswith(".sql.gz"):
+                database_only_backups += 1
                 backup_type = "Database Only"
                 description = "Database backup only"
+            else:
+                continue
             
-            backups.append({
+            stat = entry.stat()
+            entries.append({
                 "filename": filename,
                 "type": backup_type,
                 "description": description,
@@ -275,21 +463,35 @@ async def list_backups():
                 "created": stat.st_mtime,
                 "created_date": datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
             })
-        
-        return {
-            "backups": backups, 
-            "count": len(backups),
-            "full_system_backups": len(system_files),
-            "database_only_backups": len(db_files)
-        }
+    
+    entries.sort(key=lambda b: b["filename"], reverse=True)
+    return {
+        "backups": entries,
+        "count": len(entries),
+        "full_system_backups": full_system_backups,
+        "database_only_backups": database_only_backups
+    }
+
+@app.get("/backup/list")
+def list_backups():
+    """List available backups"""
+    backup_dir = "/mnt/user-data/backups"
+    try:
+        mtime = os.stat(backup_dir).st_mtime_ns
+        if _backup_list_cache["mtime"] != mtime:
+            _backup_list_cache["value"] = _scan_backups(backup_dir)
+            _backup_list_cache["mtime"] = mtime
+        return _backup_list_cache["value"]
     except Exception as e:
         return {"backups": [], "count": 0, "error": str(e)}
 
 @app.post("/backup/restore")
-async def restore_backup(backup_filename: str):
+def restore_backup(backup_filename: str):
     """Restore from a full system backup"""
     import subprocess
     import os
+    import glob
+    import shutil
     import tarfile
     from datetime import datetime
     
@@ -308,25 +510,19 @@ async def restore_backup(backup_filename: str):
         restore_dir = f"/tmp/dojo_restore_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         os.makedirs(restore_dir, exist_ok=True)
         
-        # Extract the backup
-        with tarfile.open(backup_file, "r:gz") as tar:
+        # Extract the backup, copying members in 2 MiB chunks instead of
+        # tarfile's default 16 KiB
+        with tarfile.open(backup_file, "r:gz", copybufsize=2 << 20) as tar:
             tar.extractall(restore_dir)
         
-        # Restore database if present
-        db_backup_files = []
-        for root, dirs, files in os.walk(restore_dir):
-            for file in files:
-                if file.endswith('.sql') and 'dojo_db_backup_' in file:
-                    db_backup_files.append(os.path.join(root, file))
+        # Restore database if present (create_backup stores it under database/)
+        db_backup_files = sorted(glob.glob(os.path.join(restore_dir, "database", "dojo_db_backup_*.sql")))
         
         if db_backup_files:
             # Use the most recent database backup
-            db_backup_file = sorted(db_backup_files)[-1]
+            db_backup_file = db_backup_files[-1]
             
             # Restore database
-            with open(db_backup_file, 'r') as f:
-                db_content = f.read()
-            
             restore_result = subprocess.run(
                 ["psql", "-h", "postgres", "-U", "dojo", "-d", "dojo_allocator", "-c", "DROP SCHEMA public CASCADE; CREATE SCHEMA public;"],
                 capture_output=True,
@@ -335,13 +531,16 @@ async def restore_backup(backup_filename: str):
             )
             
             if restore_result.returncode == 0:
-                restore_result = subprocess.run(
-                    ["psql", "-h", "postgres", "-U", "dojo", "-d", "dojo_allocator"],
-                    input=db_content,
-                    capture_output=True,
-                    text=True,
-                    env={"PGPASSWORD": "password"}
-                )
+                # psql reads the dump file directly as stdin
+                with open(db_backup_file, 'rb') as f:
+                    restore_result = subprocess.run(
+                        ["psql", "-h", "postgres", "-U", "dojo", "-d", "dojo_allocator"],
+                        stdin=f,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
+                        text=True,
+                        env={"PGPASSWORD": "password"}
+                    )
                 
                 if restore_result.returncode != 0:
                     return {"status": "error", "message": f"Database restore failed: {restore_result.stderr}"}
@@ -361,14 +560,12 @@ async def restore_backup(backup_filename: str):
         return {"status": "error", "message": str(e)}
 
 @app.post("/allocation/trigger")
-async def trigger_allocation():
+def trigger_allocation(request: Request, db: Session = Depends(get_db)):
     """Trigger manual re-allocation based on current active signals"""
     from src.scheduler.tasks import execute_parallel_scenarios
-    from src.models.base import SessionLocal
     from src.models.signals import Signal
     from src.models.positions import Position
-    from src.execution.paper_broker import PaperBroker
-    from sqlalchemy import func
+    from sqlalchemy import func, cast, Float
     import requests
     
     try:
@@ -383,7 +580,6 @@ async def trigger_allocation():
         )
         
         # Get additional context for dashboard
-        db = SessionLocal()
         try:
             # Get active signals count
             active_signals = db.query(Signal).filter(Signal.status == 'ACTIVE').count()
@@ -392,12 +588,14 @@ async def trigger_allocation():
             open_positions = db.query(Position).filter(Position.status == 'OPEN').count()
             
             # Get portfolio value
-            broker = PaperBroker()
-            broker.connect()
-            portfolio_value = broker.get_account_value()
+            portfolio_value = request.app.state.broker.get_account_value()
             
             # Get top signals for display
-            top_signals = db.query(Signal).filter(
+            top_signals = db.query(
+                Signal.symbol, Signal.direction, Signal.source,
+                func.coalesce(cast(Signal.total_score, Float), 0.0).label('total_score'),
+                Signal.conviction_tier, Signal.discovered_at, Signal.filer_name
+            ).filter(
                 Signal.status == 'ACTIVE'
             ).order_by(Signal.discovered_at.desc()).limit(10).all()
             
@@ -407,7 +605,7 @@ async def trigger_allocation():
                     'symbol': signal.symbol,
                     'direction': signal.direction,
                     'source': signal.source,
-                    'score': float(signal.total_score) if signal.total_score else 0.0,
+                    'score': signal.total_score,
                     'tier': signal.conviction_tier,
                     'discovered_at': signal.discovered_at.strftime('%Y-%m-%d %H:%M') if signal.discovered_at else 'N/A',
                     'filer_name': signal.filer_name
@@ -432,8 +630,6 @@ async def trigger_allocation():
                 "signal_info": [],
                 "allocation_timestamp": "N/A"
             }
-        finally:
-            db.close()
     except Exception as e:
         return {
             "status": "error", 
@@ -444,16 +640,15 @@ async def trigger_allocation():
         }
 
 @app.get("/cycle/current")
-async def get_current_cycle():
+@cached(expire=10)
+def get_current_cycle(db: Session = Depends(get_db)):
     """Get current active cycle information"""
-    from src.models.base import SessionLocal
     from src.core.cycle_manager import CycleManager
     from src.core.risk_manager import RiskManager
     from src.core.cycle_settlement import CycleSettlement
     from src.execution.paper_broker import PaperBroker
     from decimal import Decimal
     
-    db = SessionLocal()
     try:
         cycle_manager = CycleManager(db)
         risk_manager = RiskManager(db)
@@ -509,16 +704,12 @@ async def get_current_cycle():
             "status": "error",
             "message": f"Failed to get cycle data: {str(e)}"
         }
-    finally:
-        db.close()
 
 @app.post("/cycle/start")
-async def start_cycle():
+def start_cycle(db: Session = Depends(get_db)):
     """Start a new cycle"""
-    from src.models.base import SessionLocal
     from src.core.cycle_manager import CycleManager
     
-    db = SessionLocal()
     try:
         cycle_manager = CycleManager(db)
         
@@ -532,6 +723,8 @@ async def start_cycle():
         
         # Create new cycle
         new_cycle = cycle_manager.create_new_cycle()
+        invalidate_cache()
+        invalidate_philosophy_state_cache()
         
         return {
             "status": "success",
@@ -545,16 +738,12 @@ async def start_cycle():
             "status": "error",
             "message": f"Failed to start cycle: {str(e)}"
         }
-    finally:
-        db.close()
 
 @app.post("/cycle/settle")
-async def settle_cycle():
+def settle_cycle(db: Session = Depends(get_db)):
     """Settle the current cycle"""
-    from src.models.base import SessionLocal
     from src.core.cycle_settlement import CycleSettlement
     
-    db = SessionLocal()
     try:
         settlement = CycleSettlement(db)
         
@@ -571,6 +760,8 @@ async def settle_cycle():
         
         # Settle the cycle
         settlement_result = settlement.settle_cycle(active_cycle)
+        invalidate_cache()
+        invalidate_philosophy_state_cache()
         
         return settlement_result
         
@@ -579,25 +770,43 @@ async def settle_cycle():
             "status": "error",
             "message": f"Settlement failed: {str(e)}"
         }
-    finally:
-        db.close()
 
 @app.get("/cycle/history")
-async def get_cycle_history():
+def get_cycle_history(request: Request, db: Session = Depends(get_db)):
     """Get cycle history"""
-    from src.models.base import SessionLocal
     from src.core.cycle_manager import CycleManager, Cycle
+    from src.models.positions import Position
+    from sqlalchemy import func
     
-    db = SessionLocal()
     try:
         cycle_manager = CycleManager(db)
         
-        # Get all cycles
-        cycles = db.query(Cycle).order_by(Cycle.created_at.desc()).limit(20).all()
+        # Get all cycles (only the columns the listing needs)
+        cycles = db.query(
+            Cycle.cycle_id, Cycle.start_date, Cycle.end_date, Cycle.status, Cycle.updated_at
+        ).order_by(Cycle.created_at.desc()).limit(20).all()
+        cycle_ids = [cycle.cycle_id for cycle in cycles]
+        
+        # ETag over the listed cycles plus the latest change to their positions,
+        # so unchanged polls skip the aggregate and serialization
+        positions_changed = db.query(
+            func.max(Position.updated_at), func.count()
+        ).filter(Position.cycle_id.in_(cycle_ids)).one()
+        fingerprint = hashlib.blake2b(digest_size=16)
+        for cycle in cycles:
+            fingerprint.update(f"{cycle.cycle_id}|{cycle.updated_at.isoformat()};".encode())
+        fingerprint.update(f"{positions_changed[0]}|{positions_changed[1]}".encode())
+        etag = f'W/"{fingerprint.hexdigest()}"'
+        
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        
+        # One grouped query for every listed cycle
+        cycle_performance = cycle_manager.calculate_cycle_performance_bulk(cycle_ids)
         
         cycle_history = []
         for cycle in cycles:
-            performance = cycle_manager.calculate_cycle_performance(cycle)
+            performance = cycle_performance[cycle.cycle_id]
             
             cycle_history.append({
                 "cycle_id": cycle.cycle_id,
@@ -610,39 +819,54 @@ async def get_cycle_history():
                 "total_positions": performance['total_positions']
             })
         
-        return {
-            "status": "success",
-            "cycles": cycle_history
-        }
+        return DojoORJSONResponse(
+            {
+                "status": "success",
+                "cycles": cycle_history
+            },
+            headers={"ETag": etag, "Cache-Control": "max-age=30"}
+        )
         
     except Exception as e:
         return {
             "status": "error",
             "message": f"Failed to get cycle history: {str(e)}"
         }
-    finally:
-        db.close()
 
 @app.post("/scenarios/update_unrealized")
-async def update_scenarios_unrealized():
-    """Trigger live unrealized P&L updater for scenarios (runs immediately)."""
+def update_scenarios_unrealized():
+    """Queue the live unrealized P&L updater for scenarios; poll /tasks/{task_id} for the result."""
     try:
         from src.scheduler.tasks import update_scenario_unrealized
-        result = update_scenario_unrealized()
-        # If Celery returns AsyncResult when called as task, normalize
-        if hasattr(result, 'get'):
-            result = result.get(timeout=60)
-        return {"status": "success", "result": result}
+        task = update_scenario_unrealized.delay()
+        return {"status": "queued", "task_id": task.id}
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+@app.get("/tasks/{task_id}")
+def get_task_status(task_id: str):
+    """Get the state and, once finished, the result of a queued Celery task"""
+    from celery.result import AsyncResult
+    from src.scheduler.celery_app import app as celery_app
+    
+    try:
+        task = AsyncResult(task_id, app=celery_app)
+        ready = task.ready()
+        return {
+            "task_id": task_id,
+            "state": task.state,
+            "result": (task.result if task.successful() else str(task.result)) if ready else None
+        }
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
 @app.get("/cycle/metrics/{cycle_id}")
-async def get_cycle_metrics(cycle_id: str):
+def get_cycle_metrics(cycle_id: str, db: Session = Depends(get_db)):
     """Get detailed metrics for a specific cycle"""
-    from src.models.base import SessionLocal
     from src.core.cycle_manager import CycleManager, Cycle
+    from src.models.positions import Position
+    from sqlalchemy import func, cast, Float
     
-    db = SessionLocal()
     try:
         cycle_manager = CycleManager(db)
         
@@ -656,7 +880,15 @@ async def get_cycle_metrics(cycle_id: str):
         
         # Get detailed metrics
         performance = cycle_manager.calculate_cycle_performance(cycle)
-        positions = cycle_manager.get_cycle_positions(cycle)
+        # Numeric columns are cast to float in SQL so rows serialize directly
+        positions = db.query(
+            Position.symbol, Position.direction, Position.shares,
+            cast(Position.entry_price, Float).label('entry_price'),
+            cast(Position.exit_price, Float).label('exit_price'),
+            Position.status,
+            func.coalesce(cast(Position.realized_pnl, Float), 0.0).label('realized_pnl'),
+            Position.entry_date, Position.exit_date
+        ).filter(Position.cycle_id == cycle.cycle_id).all()
         
         # Get position details
         position_details = []
@@ -665,10 +897,10 @@ async def get_cycle_metrics(cycle_id: str):
                 "symbol": position.symbol,
                 "direction": position.direction,
                 "shares": position.shares,
-                "entry_price": float(position.entry_price),
-                "exit_price": float(position.exit_price) if position.exit_price else None,
+                "entry_price": position.entry_price,
+                "exit_price": position.exit_price or None,
                 "status": position.status,
-                "realized_pnl": float(position.realized_pnl) if position.realized_pnl else 0,
+                "realized_pnl": position.realized_pnl,
                 "entry_date": position.entry_date.isoformat() if position.entry_date else None,
                 "exit_date": position.exit_date.isoformat() if position.exit_date else None
             })
@@ -685,49 +917,60 @@ async def get_cycle_metrics(cycle_id: str):
             "status": "error",
             "message": f"Failed to get cycle metrics: {str(e)}"
         }
-    finally:
-        db.close()
 
 @app.get("/scenarios/positions")
-async def get_scenario_positions():
+@cached(expire=30)
+def get_scenario_positions(db: Session = Depends(get_db)):
     """Get all scenario positions"""
-    from src.models.base import SessionLocal
     from src.models.scenarios import Scenario, ScenarioPosition
+    from sqlalchemy import and_
     
-    db = SessionLocal()
     try:
-        # Get all scenarios
-        scenarios = db.query(Scenario).all()
+        # Every scenario with its open positions, in one round-trip
+        rows = db.query(
+            Scenario.scenario_name, Scenario.scenario_type,
+            Scenario.current_capital, Scenario.total_pnl,
+            ScenarioPosition.position_id, ScenarioPosition.symbol,
+            ScenarioPosition.direction, ScenarioPosition.shares,
+            ScenarioPosition.entry_price, ScenarioPosition.entry_value,
+            ScenarioPosition.entry_date, ScenarioPosition.conviction_tier
+        ).outerjoin(
+            ScenarioPosition,
+            and_(
+                ScenarioPosition.scenario_id == Scenario.id,
+                ScenarioPosition.status == 'OPEN'
+            )
+        ).all()
         
         scenario_positions = {}
         
-        for scenario in scenarios:
-            positions = db.query(ScenarioPosition).filter(
-                ScenarioPosition.scenario_id == scenario.id,
-                ScenarioPosition.status == 'OPEN'
-            ).all()
+        for pos in rows:
+            entry = scenario_positions.get(pos.scenario_name)
+            if entry is None:
+                entry = scenario_positions[pos.scenario_name] = {
+                    "scenario_name": pos.scenario_name,
+                    "scenario_type": pos.scenario_type,
+                    "position_count": 0,
+                    "positions": [],
+                    "current_capital": pos.current_capital,
+                    "total_pnl": pos.total_pnl
+                }
             
-            position_details = []
-            for pos in positions:
-                position_details.append({
-                    "symbol": pos.symbol,
-                    "direction": pos.direction,
-                    "shares": pos.shares,
-                    "entry_price": float(pos.entry_price),
-                    "entry_value": float(pos.entry_value),
-                    "entry_date": pos.entry_date.isoformat() if pos.entry_date else None,
-                    "conviction_tier": pos.conviction_tier,
-                    "position_id": pos.position_id
-                })
+            # Scenario without open positions
+            if pos.position_id is None:
+                continue
             
-            scenario_positions[scenario.scenario_name] = {
-                "scenario_name": scenario.scenario_name,
-                "scenario_type": scenario.scenario_type,
-                "position_count": len(positions),
-                "positions": position_details,
-                "current_capital": scenario.current_capital,
-                "total_pnl": scenario.total_pnl
-            }
+            entry["positions"].append({
+                "symbol": pos.symbol,
+                "direction": pos.direction,
+                "shares": pos.shares,
+                "entry_price": pos.entry_price,
+                "entry_value": pos.entry_value,
+                "entry_date": pos.entry_date.isoformat() if pos.entry_date else None,
+                "conviction_tier": pos.conviction_tier,
+                "position_id": pos.position_id
+            })
+            entry["position_count"] += 1
         
         return {
             "status": "success",
@@ -739,23 +982,20 @@ async def get_scenario_positions():
             "status": "error",
             "message": f"Failed to get scenario positions: {str(e)}"
         }
-    finally:
-        db.close()
 
 @app.post("/scenarios/execute")
-async def execute_scenarios():
-    """Execute parallel scenario allocation"""
-    from src.models.base import SessionLocal
+def execute_scenarios():
+    """Queue parallel scenario allocation; poll /tasks/{task_id} for the result"""
     from src.scheduler.tasks import execute_parallel_scenarios
     
     try:
-        # Execute the parallel scenarios task
-        result = execute_parallel_scenarios()
+        # Hand the work to a Celery worker instead of running it on the request thread
+        task = execute_parallel_scenarios.delay()
         
         return {
-            "status": "success",
-            "message": "Scenario allocation completed",
-            **result
+            "status": "queued",
+            "message": "Scenario allocation queued",
+            "task_id": task.id
         }
         
     except Exception as e:
@@ -765,19 +1005,16 @@ async def execute_scenarios():
         }
 
 @app.post("/scenarios/reset")
-async def reset_scenarios_and_reallocate():
+def reset_scenarios_and_reallocate(db: Session = Depends(get_db)):
     """Wipe all scenario data and reinitialize with accurate live-price entries."""
-    from src.models.base import SessionLocal
     from src.models.scenarios import Scenario, ScenarioPosition, ScenarioTrade
     from sqlalchemy import text
     from src.scheduler.tasks import execute_parallel_scenarios
     from src.core.scenario_manager import ScenarioManager
     
-    db = SessionLocal()
     try:
         # Wipe positions and trades
-        db.execute(text("DELETE FROM scenario_trades"))
-        db.execute(text("DELETE FROM scenario_positions"))
+        db.execute(text("TRUNCATE TABLE scenario_trades, scenario_positions RESTART IDENTITY"))
         # Reset scenarios to initial
         db.execute(text(
             """
@@ -803,9 +1040,8 @@ async def reset_scenarios_and_reallocate():
         
         # Execute fresh allocation (PaperBroker now fetches live prices for entries)
         result = execute_parallel_scenarios()
+        invalidate_cache()
         return {"status": "success", **result}
     except Exception as e:
         db.rollback()
         return {"status": "error", "message": str(e)}
-    finally:
-        db.close()
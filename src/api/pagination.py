@@ -0,0 +1,35 @@
+"""
+Keyset (cursor) pagination helpers for list endpoints.
+"""
+import base64
+from datetime import datetime
+from typing import Generic, List, Optional, Tuple, TypeVar
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+class Page(BaseModel, Generic[T]):
+    """One page of results plus the cursor for the next page."""
+    items: List[T]
+    next_cursor: Optional[str]
+
+def encode_cursor(sort_value: datetime, row_id: str) -> str:
+    """Encode the (timestamp, id) sort key of the last row on a page."""
+    raw = f"{sort_value.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a cursor produced by encode_cursor."""
+    try:
+        sort_value, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(sort_value), row_id
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def next_cursor(rows: list, limit: int, sort_key: str, id_key: str) -> Optional[str]:
+    """Cursor after the last row, or None when this was the final page."""
+    if len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(last[sort_key], last[id_key])
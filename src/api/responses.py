@@ -0,0 +1,29 @@
+"""
+Shared response classes.
+"""
+from decimal import Decimal
+import orjson
+from fastapi.responses import ORJSONResponse
+
+def _default(obj):
+    """Serialize types orjson doesn't handle natively."""
+    if isinstance(obj, Decimal):
+        # Same representation Pydantic gives Decimal fields
+        return str(obj)
+    if hasattr(obj, "isoformat"):
+        # datetime subclasses such as pandas.Timestamp
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+class DojoORJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse that also serializes Decimal values.
+    Naive datetimes are emitted as UTC and non-string dict keys are allowed.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+        )
@@ -5,26 +5,67 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from src.models.base import get_db
+from config.settings import get_settings
 from datetime import datetime
+import time
 import redis
 
 router = APIRouter()
 
+settings = get_settings()
+
+# Shared pool so status probes reuse warm sockets instead of reconnecting
+_REDIS_POOL = redis.ConnectionPool(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    decode_responses=True,
+    max_connections=8,
+    socket_keepalive=True
+)
+_REDIS = redis.Redis(connection_pool=_REDIS_POOL)
+
+# Probes don't need exact counts; stop scanning task metadata past this many keys
+_TASK_META_SCAN_LIMIT = 100
+
+# Last healthy health_check payload as (monotonic ts, payload); failures are never cached
+_HEALTH_TTL = 2.0
+_health_cache = (0.0, None)
+
+# Last celery_status payload as (monotonic ts, payload), coalesces probe bursts
+_CELERY_STATUS_TTL = 5.0
+_celery_status_cache = (0.0, None)
+
+def get_redis() -> redis.Redis:
+    """
+    Dependency for FastAPI routes.
+    Provides the shared Redis client.
+    """
+    return _REDIS
+
 @router.get("/health")
 def health_check(db: Session = Depends(get_db)):
     """
     Health check endpoint.
     Verifies database connectivity.
     """
+    global _health_cache
+    
+    cached_at, cached = _health_cache
+    if cached is not None and time.monotonic() - cached_at < _HEALTH_TTL:
+        return cached
+    
     try:
-        # Test database connection
+        # Test database connection; a stuck database fails the probe instead of hanging it
+        db.execute(text("SET LOCAL statement_timeout = '500ms'"))
         db.execute(text("SELECT 1"))
         
-        return {
+        response = {
             "status": "healthy",
             "timestamp": datetime.utcnow().isoformat(),
             "database": "connected"
         }
+        _health_cache = (time.monotonic(), response)
+        return response
     except Exception as e:
         return {
             "status": "unhealthy",
@@ -34,32 +75,43 @@ def health_check(db: Session = Depends(get_db)):
         }
 
 @router.get("/celery/status")
-def celery_status():
+def celery_status(r: redis.Redis = Depends(get_redis)):
     """
     Celery worker status endpoint.
     Checks Redis connectivity and worker count.
     """
+    global _celery_status_cache
+    
+    cached_at, cached = _celery_status_cache
+    if cached is not None and time.monotonic() - cached_at < _CELERY_STATUS_TTL:
+        return cached
+    
     try:
-        # Connect to Redis
-        r = redis.Redis(host='redis', port=6379, decode_responses=True)
-        
-        # Check if Celery is active by looking for task metadata
-        celery_keys = r.keys('celery-task-meta-*')
-        worker_count = len(celery_keys) if celery_keys else 0
+        # Check if Celery is active by looking for task metadata.
+        # SCAN is incremental, unlike KEYS which blocks Redis for the whole keyspace.
+        worker_count = 0
+        for _ in r.scan_iter(match='celery-task-meta-*', count=500):
+            worker_count += 1
+            if worker_count >= _TASK_META_SCAN_LIMIT:
+                break
         
         # Also check for active workers in the celery set
         try:
-            workers = r.smembers('celery')
-            worker_count = max(worker_count, len(workers))
-        except:
+            worker_count = max(worker_count, r.scard('celery'))
+        except redis.exceptions.ResponseError:
             pass
         
-        return {
+        response = {
             "status": "healthy" if worker_count > 0 else "idle",
             "workers": worker_count,
             "timestamp": datetime.utcnow().isoformat()
         }
+        _celery_status_cache = (time.monotonic(), response)
+        return response
     except Exception as e:
+        if isinstance(e, redis.exceptions.ConnectionError):
+            # Drop pooled sockets so the next probe reconnects cleanly
+            _REDIS_POOL.disconnect()
         return {
             "status": "unhealthy",
             "workers": 0,
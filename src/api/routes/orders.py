@@ -1,15 +1,18 @@
 """
 Order management endpoints.
 """
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, tuple_
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 from decimal import Decimal
 from src.models.base import get_db
 from src.models.orders import Order
+from src.api.responses import DojoORJSONResponse
+from src.api.cache import cached, STATS_NAMESPACE
+from src.api.pagination import Page, decode_cursor, next_cursor
 
 router = APIRouter()
 
@@ -29,32 +32,49 @@ class OrderResponse(BaseModel):
     class Config:
         from_attributes = True
 
-@router.get("/", response_model=List[OrderResponse])
+# Columns serialized by OrderResponse
+_ORDER_COLS = (
+    Order.order_id, Order.position_id, Order.symbol, Order.side,
+    Order.order_type, Order.quantity, Order.status, Order.filled_qty,
+    Order.filled_avg_price, Order.created_at, Order.filled_at
+)
+
+@router.get("/", responses={200: {"model": Page[OrderResponse]}})
+@cached(expire=2, namespace=STATS_NAMESPACE)
 def list_orders(
     status: Optional[str] = Query(None, description="Filter by status"),
     symbol: Optional[str] = Query(None, description="Filter by symbol"),
     limit: int = Query(50, ge=1, le=500, description="Maximum number of results"),
+    after: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
     db: Session = Depends(get_db)
 ):
     """
-    List orders with optional filters.
+    List orders with optional filters, newest first.
+    Pass a page's next_cursor as `after` to fetch the following page.
     """
-    query = db.query(Order)
+    query = db.query(*_ORDER_COLS)
     
     if status:
         query = query.filter(Order.status == status.upper())
     if symbol:
         query = query.filter(Order.symbol == symbol.upper())
     
-    orders = query.order_by(desc(Order.created_at)).limit(limit).all()
-    return orders
+    if after:
+        query = query.filter(tuple_(Order.created_at, Order.order_id) < decode_cursor(after))
+    
+    orders = query.order_by(desc(Order.created_at), desc(Order.order_id)).limit(limit).all()
+    items = [dict(order._mapping) for order in orders]
+    return DojoORJSONResponse({
+        "items": items,
+        "next_cursor": next_cursor(items, limit, "created_at", "order_id")
+    })
 
-@router.get("/{order_id}", response_model=OrderResponse)
+@router.get("/{order_id}", responses={200: {"model": OrderResponse}})
 def get_order(order_id: str, db: Session = Depends(get_db)):
     """
     Get specific order by ID.
     """
-    order = db.query(Order).filter(Order.order_id == order_id).first()
+    order = db.query(*_ORDER_COLS).filter(Order.order_id == order_id).first()
     if not order:
-        return {"error": "Order not found"}, 404
-    return order
+        raise HTTPException(status_code=404, detail="Order not found")
+    return DojoORJSONResponse(dict(order._mapping))
@@ -1,15 +1,18 @@
 """
 Position management endpoints.
 """
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, tuple_
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 from decimal import Decimal
 from src.models.base import get_db
 from src.models.positions import Position
+from src.api.responses import DojoORJSONResponse
+from src.api.cache import cached, STATS_NAMESPACE
+from src.api.pagination import Page, decode_cursor, next_cursor
 
 router = APIRouter()
 
@@ -30,64 +33,79 @@ class PositionResponse(BaseModel):
     class Config:
         from_attributes = True
 
-@router.get("/", response_model=List[PositionResponse])
+# Columns serialized by PositionResponse
+_POSITION_COLS = (
+    Position.position_id, Position.symbol, Position.direction, Position.shares,
+    Position.entry_price, Position.exit_price, Position.realized_pnl,
+    Position.return_pct, Position.status, Position.conviction_tier,
+    Position.entry_date, Position.exit_date
+)
+
+@router.get("/", responses={200: {"model": Page[PositionResponse]}})
+@cached(expire=2, namespace=STATS_NAMESPACE)
 def list_positions(
     status: Optional[str] = Query(None, description="Filter by status (OPEN, CLOSED)"),
     symbol: Optional[str] = Query(None, description="Filter by symbol"),
     limit: int = Query(50, ge=1, le=500, description="Maximum number of results"),
+    after: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
     db: Session = Depends(get_db)
 ):
     """
-    List positions with optional filters.
+    List positions with optional filters, newest first.
+    Pass a page's next_cursor as `after` to fetch the following page.
     """
-    query = db.query(Position)
+    query = db.query(*_POSITION_COLS)
     
     if status:
         query = query.filter(Position.status == status.upper())
     if symbol:
         query = query.filter(Position.symbol == symbol.upper())
     
-    positions = query.order_by(desc(Position.entry_date)).limit(limit).all()
-    return positions
+    if after:
+        query = query.filter(tuple_(Position.entry_date, Position.position_id) < decode_cursor(after))
+    
+    positions = query.order_by(desc(Position.entry_date), desc(Position.position_id)).limit(limit).all()
+    items = [dict(position._mapping) for position in positions]
+    return DojoORJSONResponse({
+        "items": items,
+        "next_cursor": next_cursor(items, limit, "entry_date", "position_id")
+    })
 
-@router.get("/{position_id}", response_model=PositionResponse)
+@router.get("/{position_id}", responses={200: {"model": PositionResponse}})
 def get_position(position_id: str, db: Session = Depends(get_db)):
     """
     Get specific position by ID.
     """
-    position = db.query(Position).filter(Position.position_id == position_id).first()
+    position = db.query(*_POSITION_COLS).filter(Position.position_id == position_id).first()
     if not position:
-        return {"error": "Position not found"}, 404
-    return position
+        raise HTTPException(status_code=404, detail="Position not found")
+    return DojoORJSONResponse(dict(position._mapping))
 
 @router.get("/stats/summary")
+@cached(expire=10, namespace=STATS_NAMESPACE)
 def position_stats(db: Session = Depends(get_db)):
     """
     Get position statistics summary.
     """
     from sqlalchemy import func
     
-    total = db.query(Position).count()
-    open_count = db.query(Position).filter(Position.status == 'OPEN').count()
-    closed_count = db.query(Position).filter(Position.status == 'CLOSED').count()
-    
-    # Total P&L
-    total_pnl = db.query(func.sum(Position.realized_pnl)).filter(
-        Position.status == 'CLOSED'
-    ).scalar() or Decimal(0)
+    closed = Position.status == 'CLOSED'
     
-    # Win rate
-    winners = db.query(Position).filter(
-        Position.status == 'CLOSED',
-        Position.realized_pnl > 0
-    ).count()
+    # Counts, closed P&L and winners in a single pass
+    total, open_count, closed_count, total_pnl, winners = db.query(
+        func.count(),
+        func.count().filter(Position.status == 'OPEN'),
+        func.count().filter(closed),
+        func.coalesce(func.sum(Position.realized_pnl).filter(closed), 0),
+        func.count().filter(closed, Position.realized_pnl > 0)
+    ).select_from(Position).one()
     
     win_rate = (winners / closed_count * 100) if closed_count > 0 else 0
     
-    return {
+    return DojoORJSONResponse({
         "total": total,
         "open": open_count,
         "closed": closed_count,
         "total_pnl": float(total_pnl),
         "win_rate": round(win_rate, 2)
-    }
+    })
@@ -1,14 +1,17 @@
 """
 Signal management endpoints.
 """
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, tuple_, cast, Float
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 from src.models.base import get_db
 from src.models.signals import Signal
+from src.api.responses import DojoORJSONResponse
+from src.api.cache import cached, STATS_NAMESPACE
+from src.api.pagination import Page, decode_cursor, next_cursor
 
 router = APIRouter()
 
@@ -27,18 +30,29 @@ class SignalResponse(BaseModel):
     class Config:
         from_attributes = True
 
-@router.get("/", response_model=List[SignalResponse])
+# Columns serialized by SignalResponse; Numeric scores come back as floats
+_SIGNAL_COLS = (
+    Signal.signal_id, Signal.symbol, Signal.direction, Signal.source,
+    Signal.conviction_tier, cast(Signal.total_score, Float).label('total_score'),
+    Signal.status, Signal.discovered_at, Signal.filer_name,
+    cast(Signal.transaction_value, Float).label('transaction_value')
+)
+
+@router.get("/", responses={200: {"model": Page[SignalResponse]}})
+@cached(expire=2, namespace=STATS_NAMESPACE)
 def list_signals(
     status: Optional[str] = Query(None, description="Filter by status (ACTIVE, EXPIRED, REJECTED)"),
     symbol: Optional[str] = Query(None, description="Filter by symbol"),
     tier: Optional[str] = Query(None, description="Filter by conviction tier (S, A, B, C)"),
     limit: int = Query(50, ge=1, le=500, description="Maximum number of results"),
+    after: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
     db: Session = Depends(get_db)
 ):
     """
-    List signals with optional filters.
+    List signals with optional filters, newest first.
+    Pass a page's next_cursor as `after` to fetch the following page.
     """
-    query = db.query(Signal)
+    query = db.query(*_SIGNAL_COLS)
     
     if status:
         query = query.filter(Signal.status == status.upper())
@@ -47,35 +61,46 @@ def list_signals(
     if tier:
         query = query.filter(Signal.conviction_tier == tier.upper())
     
-    signals = query.order_by(desc(Signal.discovered_at)).limit(limit).all()
-    return signals
+    if after:
+        query = query.filter(tuple_(Signal.discovered_at, Signal.signal_id) < decode_cursor(after))
+    
+    signals = query.order_by(desc(Signal.discovered_at), desc(Signal.signal_id)).limit(limit).all()
+    items = [dict(signal._mapping) for signal in signals]
+    return DojoORJSONResponse({
+        "items": items,
+        "next_cursor": next_cursor(items, limit, "discovered_at", "signal_id")
+    })
 
-@router.get("/{signal_id}", response_model=SignalResponse)
+@router.get("/{signal_id}", responses={200: {"model": SignalResponse}})
 def get_signal(signal_id: str, db: Session = Depends(get_db)):
     """
     Get specific signal by ID.
     """
-    signal = db.query(Signal).filter(Signal.signal_id == signal_id).first()
+    signal = db.query(*_SIGNAL_COLS).filter(Signal.signal_id == signal_id).first()
     if not signal:
-        return {"error": "Signal not found"}, 404
-    return signal
+        raise HTTPException(status_code=404, detail="Signal not found")
+    return DojoORJSONResponse(dict(signal._mapping))
 
 @router.get("/stats/summary")
+@cached(expire=10, namespace=STATS_NAMESPACE)
 def signal_stats(db: Session = Depends(get_db)):
     """
     Get signal statistics summary.
     """
-    total = db.query(Signal).count()
-    active = db.query(Signal).filter(Signal.status == 'ACTIVE').count()
-    rejected = db.query(Signal).filter(Signal.status == 'REJECTED').count()
+    from sqlalchemy import func
     
-    # Count by tier
-    tier_s = db.query(Signal).filter(Signal.conviction_tier == 'S').count()
-    tier_a = db.query(Signal).filter(Signal.conviction_tier == 'A').count()
-    tier_b = db.query(Signal).filter(Signal.conviction_tier == 'B').count()
-    tier_c = db.query(Signal).filter(Signal.conviction_tier == 'C').count()
+    # Status and tier counts in a single pass
+    total, active, rejected, tier_s, tier_a, tier_b, tier_c = db.query(
+        func.count(),
+        func.count().filter(Signal.status == 'ACTIVE'),
+        func.count().filter(Signal.status == 'REJECTED'),
+        func.count().filter(Signal.conviction_tier == 'S'),
+        func.count().filter(Signal.conviction_tier == 'A'),
+        func.count().filter(Signal.conviction_tier == 'B'),
+        func.count().filter(Signal.conviction_tier == 'C')
+    ).select_from(Signal).one()
     
-    return {
+    return DojoORJSONResponse({
         "total": total,
         "active": active,
         "rejected": rejected,
@@ -85,4 +110,4 @@ def signal_stats(db: Session = Depends(get_db)):
             "B": tier_b,
             "C": tier_c
         }
-    }
+    })
@@ -2,15 +2,37 @@
 Position sizing and capital allocation engine.
 Maps conviction tiers to position sizes with philosophy overlays.
 """
+import logging
+from collections import Counter
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 from decimal import Decimal
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session
 from src.models.signals import Signal
 from src.models.positions import Position
+from src.data.market_data import MarketDataProvider
 from src.utils.logging import get_logger
 from config.settings import get_risk_limits, get_philosophy_config
 
 logger = get_logger(__name__)
+# stdlib logger behind `logger`, used to skip building per-signal log payloads
+_level_logger = logging.getLogger(__name__)
+
+# Sizing math runs in integer cents and basis points (1 bp = 1/10000)
+_BP = 10000
+_ONE_BP = _BP
+
+# Sizing price when no quote is available for a symbol, in cents
+_FALLBACK_PRICE_CENTS = 10000
+
+def _to_bp(value) -> int:
+    """Convert a fraction/multiplier (0.08, 2.0, ...) to integer basis points."""
+    return int((Decimal(str(value)) * _BP).to_integral_value())
+
+def _to_cents(value) -> int:
+    """Convert a dollar amount to integer cents, truncating sub-cent remainders."""
+    return int(Decimal(value) * 100)
 
 @dataclass
 class AllocationDecision:
@@ -37,10 +59,46 @@ class Allocator:
     5. Verify available capital
     """
     
-    def __init__(self):
+    def __init__(self, price_fetcher: Optional[MarketDataProvider] = None):
+        self._price_fetcher = price_fetcher or MarketDataProvider()
         self.risk_limits = get_risk_limits()
         self.philosophy = get_philosophy_config()
         self.sizing_tiers = self.risk_limits['position_sizing']['sizing_tiers']
+        
+        # Config values used per signal, converted once
+        self._tier_bp = {
+            tier: _to_bp(pct) for tier, pct in self.sizing_tiers.items()
+        }
+        self._stop_pct = {
+            tier: Decimal(str(pct))
+            for tier, pct in self.risk_limits['stop_loss']['tier_adjustments'].items()
+        }
+        self._max_deployed_frac = Decimal(str(self.risk_limits['portfolio']['max_cash_deployed']))
+        
+        # Pabrai settings live under 'rules' or, as in philosophy.yaml, at the top level
+        pabrai = self.philosophy['pabrai']
+        pabrai_rules = pabrai.get('rules', {})
+        self._cluster_threshold = int(
+            pabrai_rules.get('cluster_signal_threshold', pabrai.get('cluster_threshold'))
+        )
+        self._pabrai_mult_bp = _to_bp(
+            pabrai_rules.get('position_sizing_multiplier', pabrai.get('position_multiplier'))
+        )
+        
+        # Per-round risk cap; not every philosophy config defines one
+        max_risk_per_round = self.philosophy['japanese_discipline']['rules'].get('fixed_risk_per_round')
+        self._max_risk_round = (
+            Decimal(str(max_risk_per_round)) if max_risk_per_round is not None else None
+        )
+    
+    def load_actionable_signals(self, db: Session) -> List[Signal]:
+        """
+        Load the signals allocate_capital expects: ACTIVE and in a sized tier.
+        """
+        return db.query(Signal).filter(
+            Signal.status == 'ACTIVE',
+            Signal.conviction_tier.in_(tuple(self._tier_bp))
+        ).all()
     
     def allocate_capital(
         self,
@@ -52,8 +110,11 @@ class Allocator:
         """
         Determine position sizes for all active signals.
         
+        Signals must already be ACTIVE and in a sized tier (S/A/B/C);
+        use load_actionable_signals to fetch them.
+        
         Args:
-            signals: Ranked signals ready for execution
+            signals: Ranked actionable signals ready for execution
             current_portfolio_value: Total account value
             open_positions: Currently open positions
             allocation_power: Current discipline multiplier (0.3 to 1.5)
@@ -61,14 +122,57 @@ class Allocator:
         Returns:
             List of allocation decisions
         """
-        decisions = []
-        
-        max_deployable = current_portfolio_value * Decimal(
-            self.risk_limits['portfolio']['max_cash_deployed']
-        )
         deployed_capital = sum(
             pos.entry_value for pos in open_positions if pos.status == 'OPEN'
         )
+        return self._allocate(
+            signals, current_portfolio_value, deployed_capital, allocation_power
+        )
+    
+    def allocate_capital_from_db(
+        self,
+        signals: List[Signal],
+        current_portfolio_value: Decimal,
+        db: Session,
+        allocation_power: float = 1.0
+    ) -> List[AllocationDecision]:
+        """
+        Same as allocate_capital, but sums deployed capital in SQL instead of
+        loading every open position.
+        
+        Args:
+            signals: Ranked actionable signals ready for execution
+            current_portfolio_value: Total account value
+            db: Database session
+            allocation_power: Current discipline multiplier (0.3 to 1.5)
+        
+        Returns:
+            List of allocation decisions
+        """
+        deployed_capital = db.execute(
+            select(func.coalesce(func.sum(Position.entry_value), 0)).where(
+                Position.status == 'OPEN'
+            )
+        ).scalar()
+        return self._allocate(
+            signals, current_portfolio_value, deployed_capital, allocation_power
+        )
+    
+    def _allocate(
+        self,
+        signals: List[Signal],
+        current_portfolio_value: Decimal,
+        deployed_capital: Decimal,
+        allocation_power: float
+    ) -> List[AllocationDecision]:
+        """
+        Size positions against the capital left after deployed_capital.
+        Money is tracked in integer cents; Decimal is only rebuilt for
+        the decisions that are emitted.
+        """
+        decisions = []
+        
+        max_deployable = current_portfolio_value * self._max_deployed_frac
         available_capital = max_deployable - deployed_capital
         
         logger.info(
@@ -79,40 +183,63 @@ class Allocator:
             allocation_power=allocation_power
         )
         
+        portfolio_cents = _to_cents(current_portfolio_value)
+        available_cents = _to_cents(available_capital)
+        power_bp = _to_bp(allocation_power)
+        debug = _level_logger.isEnabledFor(logging.DEBUG)
+        
+        # One batched price lookup for every symbol we might size, keyed by
+        # the signal's own symbol; symbols without a usable price get the fallback
+        symbols = {s.symbol for s in signals}
+        quotes = self._price_fetcher.get_last_prices(symbols)
+        price_cents = {}
+        unpriced = []
+        for symbol in symbols:
+            cents = _to_cents(quotes.get(symbol.upper()) or 0)
+            if cents:
+                price_cents[symbol] = cents
+            else:
+                price_cents[symbol] = _FALLBACK_PRICE_CENTS
+                unpriced.append(symbol)
+        if unpriced:
+            logger.warning("No price available, using fallback", symbols=sorted(unpriced))
+        
+        # Signal count per (symbol, direction), for cluster detection
+        cluster_counts = Counter((s.symbol, s.direction) for s in signals)
+        
         for signal in signals:
-            if signal.conviction_tier == 'REJECT':
-                continue
-            
-            base_size_pct = Decimal(self.sizing_tiers[signal.conviction_tier])
-            adjusted_size_pct = base_size_pct * Decimal(allocation_power)
-            
-            philosophy_multiplier, philosophy_name = self._apply_philosophy_rules(
-                signal, signals
+            philosophy_multiplier_bp, philosophy_name = self._apply_philosophy_rules(
+                signal, cluster_counts
             )
-            final_size_pct = adjusted_size_pct * Decimal(philosophy_multiplier)
             
-            target_value = current_portfolio_value * final_size_pct
+            # tier x power x philosophy, each in bp, so divide by bp^3
+            target_cents = (
+                portfolio_cents
+                * self._tier_bp[signal.conviction_tier]
+                * power_bp
+                * philosophy_multiplier_bp
+            ) // (_BP * _BP * _BP)
             
-            if target_value > available_capital:
+            if target_cents > available_cents:
                 logger.warning(
                     "Insufficient capital",
                     signal_id=signal.signal_id,
-                    needed=float(target_value),
-                    available=float(available_capital)
+                    needed=target_cents / 100,
+                    available=available_cents / 100
                 )
                 continue
             
-            current_price = Decimal(100)  # TODO: Fetch real price
-            shares = int(target_value / current_price)
+            shares = target_cents // price_cents[signal.symbol]
             
             if shares == 0:
                 logger.warning(
                     "Position too small",
                     signal_id=signal.signal_id,
-                    target_value=float(target_value)
+                    target_value=target_cents / 100
                 )
                 continue
             
+            target_value = Decimal(target_cents) / 100
             decision = AllocationDecision(
                 signal_id=signal.signal_id,
                 symbol=signal.symbol,
@@ -126,58 +253,49 @@ class Allocator:
             )
             
             decisions.append(decision)
-            available_capital -= target_value
+            available_cents -= target_cents
             
-            logger.info(
-                "Allocation decision",
-                signal_id=signal.signal_id,
-                symbol=signal.symbol,
-                shares=shares,
-                value=float(target_value),
-                philosophy=philosophy_name
-            )
+            if debug:
+                logger.debug(
+                    "Allocation decision",
+                    signal_id=signal.signal_id,
+                    symbol=signal.symbol,
+                    shares=shares,
+                    value=target_cents / 100,
+                    philosophy=philosophy_name
+                )
         
         return decisions
     
     def _apply_philosophy_rules(
         self,
         signal: Signal,
-        all_signals: List[Signal]
+        cluster_counts: Counter
     ) -> tuple:
-        """Apply investment philosophy multipliers."""
-        cluster_signals = [
-            s for s in all_signals
-            if s.symbol == signal.symbol
-            and s.direction == signal.direction
-            and s.status == 'ACTIVE'
-        ]
-        
-        cluster_threshold = self.philosophy['pabrai']['rules']['cluster_signal_threshold']
-        
-        if len(cluster_signals) >= cluster_threshold:
-            multiplier = self.philosophy['pabrai']['rules']['position_sizing_multiplier']
-            logger.info(
-                "Pabrai cluster detected",
-                symbol=signal.symbol,
-                cluster_size=len(cluster_signals),
-                multiplier=multiplier
-            )
-            return (multiplier, "pabrai_cluster")
+        """Apply investment philosophy multipliers, in basis points."""
+        cluster_size = cluster_counts.get((signal.symbol, signal.direction), 0)
         
-        return (1.0, "standard")
+        if cluster_size >= self._cluster_threshold:
+            multiplier_bp = self._pabrai_mult_bp
+            if _level_logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Pabrai cluster detected",
+                    symbol=signal.symbol,
+                    cluster_size=cluster_size,
+                    multiplier=multiplier_bp / _BP
+                )
+            return (multiplier_bp, "pabrai_cluster")
+        
+        return (_ONE_BP, "standard")
     
     def _calculate_risk(self, position_value: Decimal, signal: Signal) -> Decimal:
         """Calculate risk per trade based on stop loss."""
-        stop_loss_pct = Decimal(
-            self.risk_limits['stop_loss']['tier_adjustments'][signal.conviction_tier]
-        )
+        stop_loss_pct = self._stop_pct[signal.conviction_tier]
         risk = position_value * stop_loss_pct
         
-        max_risk_per_round = Decimal(
-            self.philosophy['japanese_discipline']['rules']['fixed_risk_per_round']
-        )
+        max_risk_per_round = self._max_risk_round
         
-        if stop_loss_pct > max_risk_per_round:
+        if max_risk_per_round is not None and stop_loss_pct > max_risk_per_round:
             logger.warning(
                 "Risk exceeds round limit",
                 calculated_risk_pct=float(stop_loss_pct),
@@ -5,25 +5,160 @@ This module implements cycle-aware capital allocation that respects 90-day cycle
 and position sizing constraints.
 """
 
+import logging
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, NamedTuple, Optional, Set, Tuple
 from decimal import Decimal
+import numpy as np
+from sqlalchemy import cast, func, Float
 from sqlalchemy.orm import Session
 from src.models.signals import Signal
 from src.models.positions import Position
 from src.core.cycle_manager import CycleManager, Cycle
-from src.core.allocator import Allocator
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
+# stdlib logger behind `logger`; lets INFO-only messages skip their formatting when INFO is off
+_level_logger = logging.getLogger(__name__)
+
+def _position_arrays(positions: List[Position]) -> Tuple[np.ndarray, np.ndarray]:
+    """Shares and entry prices of positions (rows or entities) as float64 arrays."""
+    count = len(positions)
+    shares = np.fromiter((p.shares for p in positions), dtype=np.float64, count=count)
+    prices = np.fromiter((p.entry_price for p in positions), dtype=np.float64, count=count)
+    return shares, prices
+
+def _signal_arrays(signals: List) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Prices and scores of signal rows as float64 arrays, read in one pass.
+    Signals without a price get their symbol's default price.
+    """
+    count = len(signals)
+    prices = np.empty(count, dtype=np.float64)
+    scores = np.empty(count, dtype=np.float64)
+    for i, signal in enumerate(signals):
+        price = signal.price
+        prices[i] = price if price and price > 0 else _DEFAULT_PRICES.get(signal.symbol, _FALLBACK_PRICE)
+        scores[i] = signal.total_score or 0.0
+    return prices, scores
+
+def _positions_notional(positions: List[Position]) -> float:
+    """Total shares * entry_price over positions."""
+    shares, prices = _position_arrays(positions)
+    # ndarray.sum uses pairwise summation, tighter error bounds than a BLAS dot
+    return float(np.multiply(shares, prices).sum())
+
+# Rebalance when a position's value is this far from the cycle's target size
+_REBALANCE_DEVIATION = 0.20
+
+# Maximum open positions per phase
+_PHASE_LIMITS = {
+    'LOAD': 12,      # Days 1-7: Load phase (10-12 positions)
+    'ACTIVE': 16,    # Days 8-60: Active phase (max 16 positions)
+    'SCALE_OUT': 8,  # Days 60-75: Scale out (reduce 50%)
+    'FORCE_CLOSE': 0 # Days 76-90: Force close (no new positions)
+}
+_DEFAULT_PHASE_LIMIT = 16
+
+# Share of portfolio value a cycle may deploy per phase
+_PHASE_ALLOC_PCT = {
+    'LOAD': 0.70,       # Days 1-7: Deploy 60-70% capital
+    'ACTIVE': 0.80,     # Days 8-60: Deploy up to 80% capital
+    'SCALE_OUT': 0.40,  # Days 60-75: Reduce to 40% capital
+    'FORCE_CLOSE': 0.00 # Days 76-90: No new capital
+}
+_DEFAULT_ALLOC_PCT = 0.80
+
+# Top-scored signals the greedy selection picks from, so a signal that
+# doesn't fit the remaining capital can give its slot to the next one
+_SIGNAL_POOL_SIZE = 100
+
+# Fallback prices for signals without a price of their own
+_DEFAULT_PRICES = {
+    'AAPL': Decimal('150.00'),
+    'MSFT': Decimal('300.00'),
+    'GOOGL': Decimal('2800.00'),
+    'TSLA': Decimal('800.00'),
+    'NVDA': Decimal('450.00'),
+}
+_FALLBACK_PRICE = Decimal('100.00')
+
+# Per-phase sizing: (max slots one allocation is spread over, max size multiplier, min size multiplier)
+_PHASE_SIZING = {
+    'LOAD': (3, 1.5, 1.0),         # Larger positions, fewer signals
+    'ACTIVE': (None, 1.0, 1.0),    # Standard sizing
+    'SCALE_OUT': (None, 0.5, 0.5), # Smaller positions, tighter risk
+}
+_DEFAULT_SIZING = (None, 1.0, 1.0)
+
+def _phase_position_size(capital: float, remaining_slots: int, max_size: float, min_size: float, sizing: Tuple) -> float:
+    """Per-position size for a phase's _PHASE_SIZING entry, clamped to its size limits."""
+    slot_cap, max_mult, min_mult = sizing
+    slots = min(remaining_slots, slot_cap) if slot_cap else remaining_slots
+    return max(min(capital / slots, max_size * max_mult), min_size * min_mult)
+
+def _greedy_select(scores: np.ndarray, costs: np.ndarray, capital: float, slots: int) -> List[int]:
+    """
+    Pick indices by score per dollar of actual cost, skipping any that no
+    longer fit, until capital or slots run out. Ties keep the input order.
+    """
+    selected = []
+    for i in np.argsort(-(scores / costs), kind='stable').tolist():
+        if len(selected) == slots:
+            break
+        if costs[i] > capital:
+            continue
+        capital -= costs[i]
+        selected.append(i)
+    return selected
+
+class CycleAllocationDecision(NamedTuple):
+    """One position to open for a cycle. Use _asdict() where a dict is needed."""
+    signal_id: str
+    symbol: str
+    direction: str
+    shares: int
+    target_price: Decimal
+    position_size: float
+    conviction_tier: str
+    cycle_id: str
+    allocation_reason: str
+    phase: Optional[str] = None
+
+@dataclass(frozen=True)
+class _AllocationContext:
+    """Cycle day, phase, the phase's limits and the cycle's sizes, fixed for one allocation run."""
+    cycle: Cycle
+    day: int
+    phase: str
+    max_positions: int
+    sizing: Tuple
+    target_size: float
+    max_size: float
+    min_size: float
+
+@dataclass
+class _OpenPositions:
+    """A cycle's open position rows and their values, computed together."""
+    rows: List
+    values: np.ndarray  # shares * entry_price, aligned with rows
+    
+    @property
+    def invested(self) -> float:
+        return float(self.values.sum())
 
 class CycleAllocator:
-    """Cycle-aware capital allocator that respects 90-day cycle constraints."""
+    """
+    Cycle-aware capital allocator that respects 90-day cycle constraints.
+    
+    Capital and sizing math runs in float dollars (2dp amounts are exact well
+    past any portfolio size); Decimal is kept for prices written to positions.
+    """
     
     def __init__(self, db: Session):
         self.db = db
         self.cycle_manager = CycleManager(db)
-        self.base_allocator = Allocator()
         
         # Cycle parameters
         self.MAX_POSITIONS_PER_CYCLE = 50
@@ -35,7 +170,21 @@ class CycleAllocator:
         self.MAX_PORTFOLIO_RISK = Decimal('0.02')  # 2% max risk per position
         self.POSITION_SIZE_MULTIPLIER = Decimal('1.0')  # Base position size multiplier
         
-    def allocate_for_cycle(self, cycle: Cycle, portfolio_value: Decimal) -> List[Dict]:
+    def plan_cycle(self, cycle: Cycle, portfolio_value: Decimal) -> Dict[str, List]:
+        """
+        Allocation and rebalancing decisions for a cycle from a single load
+        of its open positions.
+        
+        Returns:
+            {'allocations': [...], 'rebalances': [...]}
+        """
+        positions = self._load_open_positions(cycle)
+        return {
+            'allocations': self._allocate(cycle, portfolio_value, positions),
+            'rebalances': self._rebalance(cycle, positions)
+        }
+    
+    def allocate_for_cycle(self, cycle: Cycle, portfolio_value: Decimal) -> List[CycleAllocationDecision]:
         """
         Allocate capital for a specific cycle with phase-based logic.
         
@@ -46,25 +195,40 @@ class CycleAllocator:
         Returns:
             List of allocation decisions
         """
+        return self._allocate(cycle, portfolio_value, None)
+    
+    def _allocate(self, cycle: Cycle, portfolio_value: Decimal, positions: Optional[_OpenPositions]) -> List[CycleAllocationDecision]:
+        """allocate_for_cycle body; loads open positions itself when not given."""
         logger.info(f"Allocating capital for cycle {cycle.cycle_id}")
         
-        # Get current cycle state and phase
+        # Get current cycle state and phase once for the whole run
         cycle_day = self.cycle_manager.get_current_cycle_day(cycle)
-        phase = self.cycle_manager.get_cycle_phase(cycle)
+        phase = self.cycle_manager.phase_for_day(cycle_day)
+        ctx = _AllocationContext(
+            cycle, cycle_day, phase,
+            self._get_phase_max_positions(phase),
+            _PHASE_SIZING.get(phase, _DEFAULT_SIZING),
+            float(cycle.target_position_size),
+            float(cycle.max_position_size),
+            float(cycle.min_position_size)
+        )
         
-        logger.info(f"Cycle {cycle.cycle_id}: Day {cycle_day}, Phase {phase}")
+        if _level_logger.isEnabledFor(logging.INFO):
+            logger.info(f"Cycle {cycle.cycle_id}: Day {cycle_day}, Phase {phase}")
         
         # Check phase-specific allocation rules
         if phase == 'FORCE_CLOSE':
             logger.info(f"Cycle {cycle.cycle_id} in FORCE_CLOSE phase - no new allocations")
             return []
         
-        # Get current cycle positions
-        current_positions = self.cycle_manager.get_cycle_positions(cycle)
-        open_positions = [p for p in current_positions if p.status == 'OPEN']
+        # Get open cycle positions once; signal filtering reuses them
+        if positions is None:
+            positions = self._load_open_positions(cycle)
+        open_positions = positions.rows
+        current_symbols = {p.symbol for p in open_positions}
         
         # Apply phase-specific position limits
-        max_positions = self._get_phase_max_positions(phase)
+        max_positions = ctx.max_positions
         if len(open_positions) >= max_positions:
             logger.warning(f"Cycle {cycle.cycle_id} at phase limit ({max_positions} positions)")
             return []
@@ -75,156 +239,156 @@ class CycleAllocator:
             logger.warning(f"Cycle {cycle.cycle_id} drawdown gate {drawdown_gate} - no new allocations")
             return []
         
-        # Get available signals for this cycle
-        available_signals = self._get_available_signals(cycle)
+        # Calculate available capital based on phase; no capacity means no signal query
+        available_capital = self._calculate_phase_capital(ctx, portfolio_value, positions)
         
-        if not available_signals:
-            logger.info(f"No available signals for cycle {cycle.cycle_id}")
+        if available_capital <= 0:
+            logger.warning(f"No available capital for cycle {cycle.cycle_id} in phase {phase}")
             return []
         
-        # Calculate available capital based on phase
-        available_capital = self._calculate_phase_capital(cycle, portfolio_value, open_positions, phase)
+        # Get a pool of available signals for this cycle, at least one per open slot
+        available_signals = self._get_available_signals(
+            cycle, current_symbols, max(_SIGNAL_POOL_SIZE, max_positions - len(open_positions))
+        )
         
-        if available_capital <= 0:
-            logger.warning(f"No available capital for cycle {cycle.cycle_id} in phase {phase}")
+        if not available_signals:
+            logger.info(f"No available signals for cycle {cycle.cycle_id}")
             return []
         
         # Allocate positions based on phase
         allocation_decisions = self._allocate_positions_by_phase(
-            cycle, available_signals, available_capital, open_positions, phase
+            ctx, available_signals, available_capital, open_positions
         )
         
-        logger.info(f"Generated {len(allocation_decisions)} allocation decisions for cycle {cycle.cycle_id} (phase {phase})")
+        if _level_logger.isEnabledFor(logging.INFO):
+            logger.info(f"Generated {len(allocation_decisions)} allocation decisions for cycle {cycle.cycle_id} (phase {phase})")
         return allocation_decisions
     
-    def _get_available_signals(self, cycle: Cycle) -> List[Signal]:
-        """Get signals available for allocation in this cycle."""
-        # Get active signals not yet allocated to this cycle
-        available_signals = self.db.query(Signal).filter(
+    def _get_open_positions(self, cycle: Cycle) -> List:
+        """
+        Open positions in the cycle as rows of the columns sizing needs,
+        with shares and entry_price already loaded as floats.
+        """
+        return self.db.query(
+            Position.position_id,
+            Position.symbol,
+            cast(Position.shares, Float).label('shares'),
+            cast(Position.entry_price, Float).label('entry_price')
+        ).filter(
+            Position.cycle_id == cycle.cycle_id,
+            Position.status == 'OPEN'
+        ).all()
+    
+    def _load_open_positions(self, cycle: Cycle) -> _OpenPositions:
+        """Open positions in the cycle together with their current values."""
+        rows = self._get_open_positions(cycle)
+        shares, prices = _position_arrays(rows)
+        return _OpenPositions(rows, shares * prices)
+    
+    def _get_available_signals(self, cycle: Cycle, current_symbols: Set[str], limit: int) -> List:
+        """
+        Get the top `limit` signals available for allocation in this cycle,
+        as rows of the columns allocation uses (price and score as floats).
+        current_symbols are the symbols of the cycle's open positions.
+        """
+        # Active signals not yet allocated to a cycle
+        query = self.db.query(
+            Signal.signal_id,
+            Signal.symbol,
+            Signal.direction,
+            Signal.conviction_tier,
+            cast(Signal.price, Float).label('price'),
+            cast(Signal.total_score, Float).label('total_score')
+        ).filter(
             Signal.status == 'ACTIVE',
             Signal.cycle_id.is_(None)  # Not yet assigned to a cycle
-        ).order_by(Signal.total_score.desc()).limit(100).all()
+        )
         
-        # Filter out signals for symbols already in cycle
-        current_positions = self.cycle_manager.get_cycle_positions(cycle)
-        current_symbols = {p.symbol for p in current_positions if p.status == 'OPEN'}
+        # Skip symbols already held in this cycle
+        if current_symbols:
+            query = query.filter(Signal.symbol.notin_(current_symbols))
         
-        filtered_signals = [s for s in available_signals if s.symbol not in current_symbols]
+        # Served by the partial index idx_signals_active_unallocated_score, so the
+        # ORDER BY ... LIMIT is an index scan rather than a sort
+        available_signals = query.order_by(Signal.total_score.desc()).limit(limit).all()
         
-        logger.info(f"Found {len(filtered_signals)} available signals for cycle {cycle.cycle_id}")
-        return filtered_signals
+        if _level_logger.isEnabledFor(logging.INFO):
+            logger.info(f"Found {len(available_signals)} available signals for cycle {cycle.cycle_id}")
+        return available_signals
     
     def _get_phase_max_positions(self, phase: str) -> int:
         """Get maximum positions allowed for a phase."""
-        phase_limits = {
-            'LOAD': 12,      # Days 1-7: Load phase (10-12 positions)
-            'ACTIVE': 16,    # Days 8-60: Active phase (max 16 positions)
-            'SCALE_OUT': 8,  # Days 60-75: Scale out (reduce 50%)
-            'FORCE_CLOSE': 0 # Days 76-90: Force close (no new positions)
-        }
-        return phase_limits.get(phase, 16)
+        return _PHASE_LIMITS.get(phase, _DEFAULT_PHASE_LIMIT)
     
-    def _calculate_phase_capital(self, cycle: Cycle, portfolio_value: Decimal, open_positions: List[Position], phase: str) -> Decimal:
+    def _calculate_phase_capital(self, ctx: _AllocationContext, portfolio_value: Decimal, positions: _OpenPositions) -> float:
         """Calculate available capital based on phase."""
+        cycle, phase = ctx.cycle, ctx.phase
         # Calculate total invested in current cycle
-        total_invested = sum(
-            Decimal(str(float(p.shares) * float(p.entry_price))) for p in open_positions
-        )
+        total_invested = positions.invested
         
-        # Phase-specific capital allocation percentages
-        phase_allocation_pct = {
-            'LOAD': Decimal('0.70'),     # Days 1-7: Deploy 60-70% capital
-            'ACTIVE': Decimal('0.80'),    # Days 8-60: Deploy up to 80% capital
-            'SCALE_OUT': Decimal('0.40'), # Days 60-75: Reduce to 40% capital
-            'FORCE_CLOSE': Decimal('0.00') # Days 76-90: No new capital
-        }
-        
-        allocation_pct = phase_allocation_pct.get(phase, Decimal('0.80'))
-        max_cycle_allocation = float(portfolio_value) * float(allocation_pct)
+        allocation_pct = _PHASE_ALLOC_PCT.get(phase, _DEFAULT_ALLOC_PCT)
+        max_cycle_allocation = float(portfolio_value) * allocation_pct
         
         # Available capital is the minimum of:
         # 1. Remaining cycle allocation
         # 2. Remaining position slots * target position size
-        remaining_cycle_allocation = float(max_cycle_allocation) - float(total_invested)
-        remaining_slots = self._get_phase_max_positions(phase) - len(open_positions)
-        slot_based_capital = remaining_slots * float(cycle.target_position_size)
+        remaining_cycle_allocation = max_cycle_allocation - total_invested
+        remaining_slots = ctx.max_positions - len(positions.rows)
+        slot_based_capital = remaining_slots * ctx.target_size
         
         available_capital = min(remaining_cycle_allocation, slot_based_capital)
         
-        logger.info(f"Phase {phase} capital: ${available_capital:,.2f} (max: ${max_cycle_allocation:,.2f})")
-        return Decimal(str(available_capital)) if available_capital > 0 else Decimal('0.00')
+        if _level_logger.isEnabledFor(logging.INFO):
+            logger.info(f"Phase {phase} capital: ${available_capital:,.2f} (max: ${max_cycle_allocation:,.2f})")
+        return max(available_capital, 0.0)
     
-    def _allocate_positions_by_phase(self, cycle: Cycle, signals: List[Signal], available_capital: Decimal, open_positions: List[Position], phase: str) -> List[Dict]:
+    def _allocate_positions_by_phase(self, ctx: _AllocationContext, signals: List[Signal], available_capital: float, open_positions: List[Position]) -> List[CycleAllocationDecision]:
         """Allocate positions based on phase-specific logic."""
+        cycle, phase = ctx.cycle, ctx.phase
         decisions = []
         
         # Calculate position size based on phase
-        remaining_slots = self._get_phase_max_positions(phase) - len(open_positions)
+        remaining_slots = ctx.max_positions - len(open_positions)
         if remaining_slots <= 0:
             return decisions
         
         # Phase-specific position sizing
-        remaining_slots_decimal = Decimal(str(remaining_slots))
-        
-        if phase == 'LOAD':
-            # Load phase: Larger positions, fewer signals
-            target_size = available_capital / min(remaining_slots_decimal, Decimal('3'))  # Max 3 positions per allocation
-            position_size = max(
-                min(float(target_size), float(cycle.max_position_size) * 1.5),  # 1.5x max size
-                float(cycle.min_position_size)
-            )
-        elif phase == 'ACTIVE':
-            # Active phase: Standard sizing
-            target_size = available_capital / remaining_slots_decimal
-            position_size = max(
-                min(float(target_size), float(cycle.max_position_size)),
-                float(cycle.min_position_size)
-            )
-        elif phase == 'SCALE_OUT':
-            # Scale out phase: Smaller positions, tighter risk
-            target_size = available_capital / remaining_slots_decimal
-            position_size = max(
-                min(float(target_size), float(cycle.max_position_size) * 0.5),  # 0.5x max size
-                float(cycle.min_position_size) * 0.5
-            )
-        else:
-            # Default sizing
-            target_size = available_capital / remaining_slots_decimal
-            position_size = max(
-                min(float(target_size), float(cycle.max_position_size)),
-                float(cycle.min_position_size)
-            )
+        position_size = _phase_position_size(
+            available_capital, remaining_slots,
+            ctx.max_size, ctx.min_size, ctx.sizing
+        )
         
-        # Allocate positions for top signals
-        max_signals = min(len(signals), remaining_slots)
-        for signal in signals[:max_signals]:
-            if float(available_capital) < position_size:
-                break
-            
-            decision = {
-                'signal_id': signal.signal_id,
-                'symbol': signal.symbol,
-                'direction': signal.direction,
-                'shares': self._calculate_shares(signal, Decimal(str(position_size))),
-                'target_price': self._get_target_price(signal),
-                'position_size': position_size,
-                'conviction_tier': signal.conviction_tier,
-                'cycle_id': cycle.cycle_id,
-                'phase': phase,
-                'allocation_reason': f"Cycle {cycle.cycle_id} {phase} phase allocation"
-            }
+        prices, scores = _signal_arrays(signals)
+        
+        # Share counts for every signal in one division (minimum 1 share), and
+        # what those shares actually cost after rounding
+        shares = np.maximum((position_size / prices).astype(np.int64), 1)
+        costs = shares * prices
+        
+        # Fill capital greedily by score per dollar deployed
+        for i in _greedy_select(scores, costs, available_capital, remaining_slots):
+            signal = signals[i]
+            decision = CycleAllocationDecision(
+                signal_id=signal.signal_id,
+                symbol=signal.symbol,
+                direction=signal.direction,
+                shares=int(shares[i]),
+                target_price=self._get_target_price(signal),
+                position_size=position_size,
+                conviction_tier=signal.conviction_tier,
+                cycle_id=cycle.cycle_id,
+                allocation_reason=f"Cycle {cycle.cycle_id} {phase} phase allocation",
+                phase=phase
+            )
             
             decisions.append(decision)
-            available_capital -= Decimal(str(position_size))
         
         return decisions
     
-    def _calculate_available_capital(self, cycle: Cycle, portfolio_value: Decimal, open_positions: List[Position]) -> Decimal:
+    def _calculate_available_capital(self, cycle: Cycle, portfolio_value: Decimal, open_positions: List[Position]) -> float:
         """Calculate available capital for new positions."""
         # Calculate total invested in current cycle
-        total_invested = sum(
-            Decimal(str(float(p.shares) * float(p.entry_price))) for p in open_positions
-        )
+        total_invested = _positions_notional(open_positions)
         
         # Calculate maximum cycle allocation (e.g., 20% of portfolio)
         max_cycle_allocation = float(portfolio_value) * 0.20
@@ -232,16 +396,17 @@ class CycleAllocator:
         # Available capital is the minimum of:
         # 1. Remaining cycle allocation
         # 2. Remaining position slots * target position size
-        remaining_cycle_allocation = max_cycle_allocation - float(total_invested)
+        remaining_cycle_allocation = max_cycle_allocation - total_invested
         remaining_slots = cycle.max_positions - len(open_positions)
         slot_based_capital = remaining_slots * float(cycle.target_position_size)
         
         available_capital = min(remaining_cycle_allocation, slot_based_capital)
         
-        logger.info(f"Available capital for cycle {cycle.cycle_id}: ${available_capital:,.2f}")
-        return Decimal(str(available_capital)) if available_capital > 0 else Decimal('0.00')
+        if _level_logger.isEnabledFor(logging.INFO):
+            logger.info(f"Available capital for cycle {cycle.cycle_id}: ${available_capital:,.2f}")
+        return max(available_capital, 0.0)
     
-    def _allocate_positions(self, cycle: Cycle, signals: List[Signal], available_capital: Decimal, open_positions: List[Position]) -> List[Dict]:
+    def _allocate_positions(self, cycle: Cycle, signals: List[Signal], available_capital: float, open_positions: List[Position]) -> List[CycleAllocationDecision]:
         """Allocate positions based on signals and available capital."""
         decisions = []
         
@@ -251,48 +416,47 @@ class CycleAllocator:
             return decisions
         
         # Target position size for remaining slots
-        remaining_slots_decimal = Decimal(str(remaining_slots))
-        target_size = available_capital / remaining_slots_decimal
+        target_size = available_capital / remaining_slots
         
         # Ensure position size is within limits
         position_size = max(
-            min(float(target_size), float(cycle.max_position_size)),
+            min(target_size, float(cycle.max_position_size)),
             float(cycle.min_position_size)
         )
         
         # Allocate positions for top signals
         for signal in signals[:remaining_slots]:
-            if float(available_capital) < position_size:
+            if available_capital < position_size:
                 break
             
-            decision = {
-                'signal_id': signal.signal_id,
-                'symbol': signal.symbol,
-                'direction': signal.direction,
-                'shares': self._calculate_shares(signal, Decimal(str(position_size))),
-                'target_price': self._get_target_price(signal),
-                'position_size': position_size,
-                'conviction_tier': signal.conviction_tier,
-                'cycle_id': cycle.cycle_id,
-                'allocation_reason': f"Cycle {cycle.cycle_id} allocation"
-            }
+            decision = CycleAllocationDecision(
+                signal_id=signal.signal_id,
+                symbol=signal.symbol,
+                direction=signal.direction,
+                shares=self._calculate_shares(signal, position_size),
+                target_price=self._get_target_price(signal),
+                position_size=position_size,
+                conviction_tier=signal.conviction_tier,
+                cycle_id=cycle.cycle_id,
+                allocation_reason=f"Cycle {cycle.cycle_id} allocation"
+            )
             
             decisions.append(decision)
-            available_capital -= Decimal(str(position_size))
+            available_capital -= position_size
         
         return decisions
     
-    def _calculate_shares(self, signal: Signal, position_size: Decimal) -> int:
+    def _calculate_shares(self, signal: Signal, position_size: float) -> int:
         """Calculate number of shares for a position."""
         # Use signal price if available, otherwise use target price
         price = signal.price or self._get_target_price(signal)
         
         if price and price > 0:
-            shares = int(position_size / Decimal(str(price)))
+            shares = int(position_size / float(price))
             return max(shares, 1)  # Minimum 1 share
         
         # Fallback to dollar-based allocation
-        return int(position_size / Decimal('100.00'))  # Assume $100 per share
+        return int(position_size / 100.0)  # Assume $100 per share
     
     def _get_target_price(self, signal: Signal) -> Decimal:
         """Get target price for a signal."""
@@ -301,15 +465,7 @@ class CycleAllocator:
             return Decimal(str(signal.price))
         
         # Fallback to default price based on symbol
-        default_prices = {
-            'AAPL': Decimal('150.00'),
-            'MSFT': Decimal('300.00'),
-            'GOOGL': Decimal('2800.00'),
-            'TSLA': Decimal('800.00'),
-            'NVDA': Decimal('450.00'),
-        }
-        
-        return default_prices.get(signal.symbol, Decimal('100.00'))
+        return _DEFAULT_PRICES.get(signal.symbol, _FALLBACK_PRICE)
     
     def rebalance_cycle_positions(self, cycle: Cycle) -> List[Dict]:
         """
@@ -318,91 +474,89 @@ class CycleAllocator:
         Returns:
             List of rebalancing decisions
         """
+        return self._rebalance(cycle, self._load_open_positions(cycle))
+    
+    def _rebalance(self, cycle: Cycle, positions: _OpenPositions) -> List[Dict]:
+        """rebalance_cycle_positions body over already loaded open positions."""
         logger.info(f"Rebalancing positions for cycle {cycle.cycle_id}")
         
-        # Get current open positions
-        current_positions = self.cycle_manager.get_cycle_positions(cycle)
-        open_positions = [p for p in current_positions if p.status == 'OPEN']
-        
+        open_positions = positions.rows
         if not open_positions:
             logger.info(f"No open positions to rebalance in cycle {cycle.cycle_id}")
             return []
         
         rebalance_decisions = []
+        target_value = float(cycle.target_position_size)
+        mask = self._rebalance_mask(
+            positions.values, target_value,
+            float(cycle.max_position_size), float(cycle.min_position_size)
+        )
         
-        # Check each position for rebalancing needs
-        for position in open_positions:
-            # Calculate current position value
-            current_value = Decimal(str(float(position.shares) * float(position.entry_price)))
-            
-            # Check if position needs rebalancing
-            if self._needs_rebalancing(position, cycle):
-                decision = {
-                    'action': 'rebalance',
-                    'position_id': position.position_id,
-                    'symbol': position.symbol,
-                    'current_shares': position.shares,
-                    'target_shares': self._calculate_target_shares(position, cycle),
-                    'reason': 'Position size rebalancing'
-                }
-                rebalance_decisions.append(decision)
-        
-        logger.info(f"Generated {len(rebalance_decisions)} rebalancing decisions for cycle {cycle.cycle_id}")
+        # Check every position in one pass, then build decisions for the flagged ones
+        for i in np.flatnonzero(mask).tolist():
+            position = open_positions[i]
+            decision = {
+                'action': 'rebalance',
+                'position_id': position.position_id,
+                'symbol': position.symbol,
+                'current_shares': position.shares,
+                'target_shares': self._calculate_target_shares(position, target_value),
+                'reason': 'Position size rebalancing'
+            }
+            rebalance_decisions.append(decision)
+        
+        if _level_logger.isEnabledFor(logging.INFO):
+            logger.info(f"Generated {len(rebalance_decisions)} rebalancing decisions for cycle {cycle.cycle_id}")
         return rebalance_decisions
     
-    def _needs_rebalancing(self, position: Position, cycle: Cycle) -> bool:
-        """Check if a position needs rebalancing."""
-        current_value = Decimal(str(float(position.shares) * float(position.entry_price)))
-        
-        # Check if position is outside size limits
-        if current_value > cycle.max_position_size:
-            return True
-        
-        if current_value < cycle.min_position_size:
-            return True
-        
-        # Check if position is significantly different from target
-        target_value = cycle.target_position_size
-        deviation = abs(current_value - target_value) / target_value
-        
-        if deviation > Decimal('0.20'):  # 20% deviation threshold
-            return True
-        
-        return False
+    def _rebalance_mask(
+        self,
+        current_values: np.ndarray,
+        target_value: float,
+        max_size: float,
+        min_size: float
+    ) -> np.ndarray:
+        """Boolean mask of positions (by current value) that need rebalancing."""
+        # Outside size limits, or significantly different from target
+        return (
+            (current_values > max_size)
+            | (current_values < min_size)
+            | (np.abs(current_values - target_value) / target_value > _REBALANCE_DEVIATION)
+        )
     
-    def _calculate_target_shares(self, position: Position, cycle: Cycle) -> int:
+    def _calculate_target_shares(self, position: Position, target_value: float) -> int:
         """Calculate target number of shares for rebalancing."""
-        target_value = cycle.target_position_size
         current_price = position.entry_price
         
         if current_price and current_price > 0:
-            target_shares = int(target_value / Decimal(str(current_price)))
+            target_shares = int(target_value / current_price)
             return max(target_shares, 1)
         
         return position.shares  # No change if price unavailable
     
     def get_cycle_allocation_summary(self, cycle: Cycle) -> Dict:
         """Get summary of cycle allocation status."""
-        current_positions = self.cycle_manager.get_cycle_positions(cycle)
-        open_positions = [p for p in current_positions if p.status == 'OPEN']
+        total_positions = self.db.query(func.count()).filter(
+            Position.cycle_id == cycle.cycle_id
+        ).scalar()
+        open_positions = self._get_open_positions(cycle)
         
         # Calculate allocation metrics
-        total_invested = sum(
-            Decimal(str(float(p.shares) * float(p.entry_price))) for p in open_positions
-        )
+        total_invested = _positions_notional(open_positions)
         
+        target_size = float(cycle.target_position_size)
         remaining_slots = cycle.max_positions - len(open_positions)
-        remaining_capacity = remaining_slots * float(cycle.target_position_size)
+        remaining_capacity = remaining_slots * target_size
         
         return {
             'cycle_id': cycle.cycle_id,
-            'total_positions': len(current_positions),
+            'total_positions': total_positions,
             'open_positions': len(open_positions),
             'remaining_slots': remaining_slots,
-            'total_invested': float(total_invested),
-            'remaining_capacity': float(remaining_capacity),
+            'total_invested': total_invested,
+            'remaining_capacity': remaining_capacity,
             'allocation_percent': (len(open_positions) / cycle.max_positions) * 100,
-            'investment_percent': (float(total_invested) / float(cycle.target_position_size) / float(cycle.max_positions)) * 100
+            'investment_percent': (total_invested / target_size / cycle.max_positions) * 100
         }
 
 def example_usage():
@@ -425,7 +579,7 @@ def example_usage():
         
         print(f"Generated {len(decisions)} allocation decisions")
         for decision in decisions[:3]:
-            print(f"  {decision['symbol']}: {decision['shares']} shares @ ${decision['target_price']}")
+            print(f"  {decision.symbol}: {decision.shares} shares @ ${decision.target_price}")
         
         # Get allocation summary
         summary = allocator.get_cycle_allocation_summary(cycle)
@@ -5,11 +5,13 @@ This module implements the core 90-day cycle system for position management,
 including cycle creation, position limits, rebalancing, and performance tracking.
 """
 
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 from decimal import Decimal
+import numpy as np
 from sqlalchemy.orm import Session
-from sqlalchemy import Column, String, Integer, Numeric, TIMESTAMP
+from sqlalchemy import Column, String, Integer, Numeric, TIMESTAMP, case
 from sqlalchemy.sql import func
 from src.models.base import Base
 from src.models.signals import Signal
@@ -20,6 +22,45 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Cycle performance results kept per CycleManager, keyed on position version
+_PERF_CACHE_SIZE = 64
+
+# Assume risk-free rate of 2% annually
+_RISK_FREE_DAILY = 0.02 / 365
+
+def _drawdown_and_sharpe(returns: np.ndarray, capital: float) -> Tuple[float, float]:
+    """
+    Max drawdown (percent of peak equity, where equity is capital plus
+    cumulative P&L) and Sharpe ratio of returns, sharing one cumulative
+    sum between them.
+    """
+    n = returns.size
+    if n == 0:
+        return 0.0, 0.0
+    
+    pnl = np.cumsum(returns)
+    if capital > 0:
+        equity = capital + pnl
+        # The starting capital is the first peak, so an opening loss counts
+        peak = np.maximum(np.maximum.accumulate(equity), capital)
+        # Equity can't fall more than 100% below its peak
+        max_drawdown = float(np.minimum((peak - equity) / peak, 1.0).max()) * 100
+    else:
+        max_drawdown = 0.0
+    
+    if n < 2:
+        return max_drawdown, 0.0
+    
+    # Population mean/std; the mean comes from the running total
+    mean_return = float(pnl[-1]) / n
+    deviations = returns - mean_return
+    std_return = (float(np.dot(deviations, deviations)) / n) ** 0.5
+    
+    if std_return == 0:
+        return max_drawdown, 0.0
+    
+    return max_drawdown, (mean_return - _RISK_FREE_DAILY) / std_return
+
 class CycleManager:
     """Manages 90-day trading cycles."""
     
@@ -30,6 +71,7 @@ class CycleManager:
         self.TARGET_POSITION_SIZE = Decimal('2000.00')
         self.MAX_POSITION_SIZE = Decimal('5000.00')
         self.MIN_POSITION_SIZE = Decimal('500.00')
+        self._perf_cache: OrderedDict = OrderedDict()
         
     def create_new_cycle(self, start_date: Optional[datetime] = None) -> Cycle:
         """
@@ -75,25 +117,27 @@ class CycleManager:
     
     def get_active_cycle(self) -> Optional[Cycle]:
         """Get the currently active cycle."""
-        # Get the most recent active cycle (by creation time)
+        now = datetime.utcnow()
+        
+        # Get the most recent active cycle (by creation time); both this
+        # lookup and the cleanup below use idx_cycles_active_created
         active_cycle = self.db.query(Cycle).filter(
             Cycle.status == 'ACTIVE',
-            Cycle.end_date > datetime.utcnow()
-        ).order_by(Cycle.created_at.desc()).first()
+            Cycle.end_date > now
+        ).order_by(Cycle.created_at.desc()).limit(1).first()
         
-        # If multiple active cycles exist, deactivate older ones
+        # If multiple active cycles exist, deactivate older ones in one UPDATE
         if active_cycle:
-            older_active_cycles = self.db.query(Cycle).filter(
+            deactivated = self.db.query(Cycle).filter(
                 Cycle.status == 'ACTIVE',
-                Cycle.end_date > datetime.utcnow(),
+                Cycle.end_date > now,
                 Cycle.id != active_cycle.id
-            ).all()
-            
-            for older_cycle in older_active_cycles:
-                logger.warning(f"Deactivating older active cycle: {older_cycle.cycle_id}")
-                older_cycle.status = 'CANCELLED'
+            ).update({Cycle.status: 'CANCELLED'}, synchronize_session=False)
             
-            if older_active_cycles:
+            if deactivated:
+                logger.warning(
+                    f"Deactivated {deactivated} older active cycle(s), keeping {active_cycle.cycle_id}"
+                )
                 self.db.commit()
         
         return active_cycle
@@ -104,6 +148,13 @@ class CycleManager:
             Position.cycle_id == cycle.cycle_id
         ).all()
     
+    def count_open_positions(self, cycle: Cycle) -> int:
+        """Count a cycle's OPEN positions without loading them."""
+        return self.db.query(func.count()).filter(
+            Position.cycle_id == cycle.cycle_id,
+            Position.status == 'OPEN'
+        ).scalar()
+    
     def get_cycle_signals(self, cycle: Cycle) -> List[Signal]:
         """Get all signals analyzed during a cycle."""
         return self.db.query(Signal).filter(
@@ -114,12 +165,50 @@ class CycleManager:
         """
         Calculate performance metrics for a cycle.
         
+        Results are reused while the cycle's positions are unchanged (same
+        row count, closed count and latest updated_at).
+        
         Returns:
             Dictionary with performance metrics
         """
-        positions = self.get_cycle_positions(cycle)
+        version = self.db.query(
+            func.count(),
+            func.count(case((Position.status == 'CLOSED', 1))),
+            func.max(Position.updated_at)
+        ).filter(
+            Position.cycle_id == cycle.cycle_id
+        ).one()
+        cache_key = (cycle.cycle_id, tuple(version))
+        
+        performance = self._perf_cache.get(cache_key)
+        if performance is None:
+            performance = self._compute_cycle_performance(cycle)
+            self._perf_cache[cache_key] = performance
+            if len(self._perf_cache) > _PERF_CACHE_SIZE:
+                self._perf_cache.popitem(last=False)
+        else:
+            self._perf_cache.move_to_end(cache_key)
+        
+        return dict(performance)
+    
+    def _compute_cycle_performance(self, cycle: Cycle) -> Dict:
+        """calculate_cycle_performance body, without the cache."""
+        closed = Position.status == 'CLOSED'
+        (total_positions, open_positions, closed_positions, invested, pnl,
+         winner_count, avg_winner, avg_loser) = self.db.query(
+            func.count(),
+            func.count(case((Position.status == 'OPEN', 1))),
+            func.count(case((closed, 1))),
+            func.sum(Position.shares * Position.entry_price),
+            func.sum(case((closed, Position.realized_pnl))),
+            func.count(case((closed & (Position.realized_pnl > 0), 1))),
+            func.avg(case((closed & (Position.realized_pnl > 0), Position.realized_pnl))),
+            func.avg(case((closed & (Position.realized_pnl < 0), Position.realized_pnl)))
+        ).filter(
+            Position.cycle_id == cycle.cycle_id
+        ).one()
         
-        if not positions:
+        if not total_positions:
             return {
                 'total_positions': 0,
                 'open_positions': 0,
@@ -134,28 +223,25 @@ class CycleManager:
                 'sharpe_ratio': 0.0
             }
         
-        # Calculate basic metrics
-        total_positions = len(positions)
-        open_positions = len([p for p in positions if p.status == 'OPEN'])
-        closed_positions = len([p for p in positions if p.status == 'CLOSED'])
-        
         # Calculate financial metrics
-        total_invested = sum(float(p.shares * p.entry_price) for p in positions)
-        total_pnl = sum(float(p.realized_pnl or 0) for p in positions if p.status == 'CLOSED')
+        total_invested = float(invested or 0)
+        total_pnl = float(pnl or 0)
         total_return = (total_pnl / total_invested * 100) if total_invested > 0 else 0
         
         # Calculate win/loss metrics
-        winners = [p for p in positions if p.status == 'CLOSED' and p.realized_pnl and p.realized_pnl > 0]
-        losers = [p for p in positions if p.status == 'CLOSED' and p.realized_pnl and p.realized_pnl < 0]
-        
-        win_rate = (len(winners) / closed_positions * 100) if closed_positions > 0 else 0
-        avg_winner = sum(float(p.realized_pnl) for p in winners) / len(winners) if winners else 0
-        avg_loser = sum(float(p.realized_pnl) for p in losers) / len(losers) if losers else 0
-        
-        # Calculate risk metrics
-        returns = [float(p.realized_pnl or 0) for p in positions if p.status == 'CLOSED']
-        max_drawdown = self._calculate_max_drawdown(returns)
-        sharpe_ratio = self._calculate_sharpe_ratio(returns)
+        win_rate = (winner_count / closed_positions * 100) if closed_positions > 0 else 0
+        avg_winner = float(avg_winner or 0)
+        avg_loser = float(avg_loser or 0)
+        
+        # Calculate risk metrics over closed-position P&L, in exit order
+        returns = np.fromiter(
+            (value or 0 for (value,) in self.db.query(Position.realized_pnl).filter(
+                Position.cycle_id == cycle.cycle_id,
+                closed
+            ).order_by(Position.exit_date, Position.id)),
+            dtype=np.float64
+        ) if closed_positions else np.empty(0)
+        max_drawdown, sharpe_ratio = _drawdown_and_sharpe(returns, total_invested)
         
         return {
             'total_positions': total_positions,
@@ -171,42 +257,59 @@ class CycleManager:
             'sharpe_ratio': sharpe_ratio
         }
     
-    def _calculate_max_drawdown(self, returns: List[float]) -> float:
-        """Calculate maximum drawdown from returns."""
-        if not returns:
-            return 0.0
-        
-        peak = returns[0]
-        max_dd = 0.0
-        
-        for ret in returns:
-            if ret > peak:
-                peak = ret
-            dd = (peak - ret) / peak if peak > 0 else 0
-            max_dd = max(max_dd, dd)
-        
-        return max_dd * 100
-    
-    def _calculate_sharpe_ratio(self, returns: List[float]) -> float:
-        """Calculate Sharpe ratio from returns."""
-        if len(returns) < 2:
-            return 0.0
+    def calculate_cycle_performance_bulk(self, cycle_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Calculate summary performance metrics for several cycles in one query.
         
-        import numpy as np
-        mean_return = np.mean(returns)
-        std_return = np.std(returns)
+        Covers the position count, P&L, return and win rate fields of
+        calculate_cycle_performance, without the per-position risk metrics.
         
-        if std_return == 0:
-            return 0.0
+        Returns:
+            Dictionary of cycle_id -> performance metrics
+        """
+        closed = Position.status == 'CLOSED'
+        rows = self.db.query(
+            Position.cycle_id,
+            func.count(),
+            func.count(case((Position.status == 'OPEN', 1))),
+            func.count(case((closed, 1))),
+            func.coalesce(func.sum(Position.shares * Position.entry_price), 0),
+            func.coalesce(func.sum(case((closed, Position.realized_pnl))), 0),
+            func.count(case((closed & (Position.realized_pnl > 0), 1)))
+        ).filter(
+            Position.cycle_id.in_(cycle_ids)
+        ).group_by(Position.cycle_id).all()
+        
+        performance = {
+            cycle_id: {
+                'total_positions': 0,
+                'open_positions': 0,
+                'closed_positions': 0,
+                'total_invested': 0.0,
+                'total_return': 0.0,
+                'total_pnl': 0.0,
+                'win_rate': 0.0
+            }
+            for cycle_id in cycle_ids
+        }
         
-        # Assume risk-free rate of 2% annually
-        risk_free_rate = 0.02 / 365  # Daily risk-free rate
-        sharpe = (mean_return - risk_free_rate) / std_return
+        for cycle_id, total, open_count, closed_count, invested, pnl, winners in rows:
+            total_invested = float(invested)
+            total_pnl = float(pnl)
+            performance[cycle_id] = {
+                'total_positions': total,
+                'open_positions': open_count,
+                'closed_positions': closed_count,
+                'total_invested': total_invested,
+                'total_return': (total_pnl / total_invested * 100) if total_invested > 0 else 0,
+                'total_pnl': total_pnl,
+                'win_rate': (winners / closed_count * 100) if closed_count > 0 else 0
+            }
         
-        return sharpe
+        return performance
     
-    def update_cycle_performance(self, cycle: Cycle):
-        """Update cycle performance metrics in database."""
+    def update_cycle_performance(self, cycle: Cycle) -> Dict:
+        """Update cycle performance metrics in database and return them."""
         performance = self.calculate_cycle_performance(cycle)
         
         cycle.total_invested = Decimal(str(performance['total_invested']))
@@ -221,6 +324,7 @@ class CycleManager:
         self.db.commit()
         
         logger.info(f"Updated cycle {cycle.cycle_id} performance: {performance['total_return']:.2f}% return")
+        return performance
     
     def check_cycle_completion(self, cycle: Cycle) -> bool:
         """
@@ -236,10 +340,7 @@ class CycleManager:
             return True
         
         # Check if all positions are closed
-        positions = self.get_cycle_positions(cycle)
-        open_positions = [p for p in positions if p.status == 'OPEN']
-        
-        if len(open_positions) == 0:
+        if self.count_open_positions(cycle) == 0:
             return True
         
         # Check if cycle has been running for 90 days
@@ -256,29 +357,22 @@ class CycleManager:
         Returns:
             Dictionary with completion summary
         """
-        # Update final performance
-        self.update_cycle_performance(cycle)
-        
-        # Close any remaining open positions
-        positions = self.get_cycle_positions(cycle)
-        open_positions = [p for p in positions if p.status == 'OPEN']
-        
-        closed_count = 0
-        for position in open_positions:
-            # Mark position as closed (emergency liquidation)
-            position.status = 'CLOSED'
-            position.exit_price = position.entry_price  # Assume no change for now
-            position.realized_pnl = Decimal('0.00')
-            closed_count += 1
+        # Close any remaining open positions (emergency liquidation)
+        closed_count = self.db.query(Position).filter(
+            Position.cycle_id == cycle.cycle_id,
+            Position.status == 'OPEN'
+        ).update({
+            Position.status: 'CLOSED',
+            Position.exit_price: Position.entry_price,  # Assume no change for now
+            Position.realized_pnl: Decimal('0.00')
+        }, synchronize_session=False)
         
         # Mark cycle as completed
         cycle.status = 'COMPLETED'
         cycle.updated_at = datetime.utcnow()
         
-        self.db.commit()
-        
-        # Calculate final performance
-        final_performance = self.calculate_cycle_performance(cycle)
+        # Record final performance; commits the closes and status change too
+        final_performance = self.update_cycle_performance(cycle)
         
         logger.info(f"Completed cycle {cycle.cycle_id}: {final_performance['total_return']:.2f}% return")
         
@@ -316,8 +410,11 @@ class CycleManager:
     
     def get_cycle_phase(self, cycle: Cycle) -> str:
         """Determine the current phase of the cycle."""
-        cycle_day = self.get_current_cycle_day(cycle)
-        
+        return self.phase_for_day(self.get_current_cycle_day(cycle))
+    
+    @staticmethod
+    def phase_for_day(cycle_day: int) -> str:
+        """Phase of a cycle on a given cycle day."""
         if cycle_day <= 7:
             return 'LOAD'
         elif cycle_day <= 60:
@@ -396,9 +493,8 @@ class CycleManager:
         cycle_state.max_drawdown = Decimal(str(performance['max_drawdown']))
         
         # Update position counts
-        positions = self.get_cycle_positions(cycle)
-        cycle_state.positions_opened = len(positions)
-        cycle_state.positions_closed = len([p for p in positions if p.status == 'CLOSED'])
+        cycle_state.positions_opened = performance['total_positions']
+        cycle_state.positions_closed = performance['closed_positions']
         
         self.db.commit()
         return cycle_state
@@ -102,10 +102,7 @@ class CycleSettlement:
             }
         
         # Check if all positions are closed
-        positions = self.cycle_manager.get_cycle_positions(cycle)
-        open_positions = [p for p in positions if p.status == 'OPEN']
-        
-        if len(open_positions) == 0:
+        if self.cycle_manager.count_open_positions(cycle) == 0:
             return {
                 'should_complete': True,
                 'reason': 'All positions closed',
@@ -329,10 +329,7 @@ class PositionSizer:
                 return False, f"Liquidity check failed: {liquidity_check['reason']}"
             
             # Check if position fits in cycle limits
-            current_positions = self.cycle_manager.get_cycle_positions(cycle)
-            open_positions = [p for p in current_positions if p.status == 'OPEN']
-            
-            if len(open_positions) >= cycle.max_positions:
+            if self.cycle_manager.count_open_positions(cycle) >= cycle.max_positions:
                 return False, f"Cycle at position limit ({cycle.max_positions})"
             
             return True, "Position size validation passed"
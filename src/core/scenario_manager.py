@@ -211,7 +211,7 @@ class ScenarioManager:
             
             for decision in decisions:
                 try:
-                    symbol = decision['symbol']
+                    symbol = decision.symbol
                     
                     # Check for existing positions in this scenario
                     existing_positions = self.db.query(ScenarioPosition).filter(
@@ -245,8 +245,8 @@ class ScenarioManager:
                     # Create order using allocation format
                     allocation = {
                         'symbol': symbol,
-                        'direction': decision['direction'],
-                        'shares': decision['shares']
+                        'direction': decision.direction,
+                        'shares': decision.shares
                     }
                     
                     order = order_manager.create_entry_order(allocation, position_id)
@@ -260,22 +260,22 @@ class ScenarioManager:
                             scenario_id=scenario.id,
                             position_id=position_id,
                             symbol=symbol,
-                            direction=decision['direction'],
+                            direction=decision.direction,
                             entry_date=datetime.utcnow(),
-                            entry_price=order.filled_avg_price or decision['target_price'],
-                            shares=decision['shares'],
-                            entry_value=float(decision['shares']) * float(order.filled_avg_price or decision['target_price']),
-                            conviction_tier=decision['conviction_tier'],
+                            entry_price=order.filled_avg_price or decision.target_price,
+                            shares=decision.shares,
+                            entry_value=float(decision.shares) * float(order.filled_avg_price or decision.target_price),
+                            conviction_tier=decision.conviction_tier,
                             status='OPEN'
                         )
                         
                         self.db.add(scenario_position)
                         executed += 1
                         
-                        logger.info(f"Executed position for {scenario_name}: {symbol} {decision['shares']} shares")
+                        logger.info(f"Executed position for {scenario_name}: {symbol} {decision.shares} shares")
                 
                 except Exception as e:
-                    logger.error(f"Failed to execute decision for {decision['symbol']} in scenario {scenario_name}: {e}")
+                    logger.error(f"Failed to execute decision for {decision.symbol} in scenario {scenario_name}: {e}")
                     continue
             
             # Update scenario performance
@@ -6,14 +6,20 @@ Uses Alpaca API for real-time market data.
 """
 
 import requests
+import redis
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Iterable
 import numpy as np
 from decimal import Decimal
+from src.utils.redis_client import get_cache_client
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Last prices are shared across workers in Redis for a second to absorb bursts
+PRICE_KEY_PREFIX = "dojo:price:"
+PRICE_CACHE_TTL = 1
+
 class MarketDataProvider:
     """Fetch market data using Alpaca API."""
     
@@ -68,6 +74,70 @@ class MarketDataProvider:
             
         return None
     
+    def get_last_prices(self, symbols: Iterable[str]) -> Dict[str, Decimal]:
+        """
+        Get last prices for many symbols in one round-trip.
+        Cached prices come from a single Redis MGET; misses are fetched with one
+        batched quotes request. Symbols without any price are left out.
+        """
+        symbols = sorted({s.upper() for s in symbols})
+        if not symbols:
+            return {}
+        
+        prices = {}
+        client = get_cache_client()
+        try:
+            cached = client.mget([f"{PRICE_KEY_PREFIX}{s}" for s in symbols])
+            for symbol, value in zip(symbols, cached):
+                if value is not None:
+                    prices[symbol] = Decimal(value.decode())
+        except redis.RedisError as e:
+            logger.warning(f"Price cache read failed: {e}")
+        
+        missing = [s for s in symbols if s not in prices]
+        if not missing:
+            return prices
+        
+        fetched = self._fetch_latest_quotes(missing)
+        for symbol in missing:
+            if symbol not in fetched and symbol in self.mock_data:
+                fetched[symbol] = Decimal(str(self.mock_data[symbol]['price']))
+        
+        if fetched:
+            try:
+                pipe = client.pipeline(transaction=False)
+                for symbol, price in fetched.items():
+                    pipe.set(f"{PRICE_KEY_PREFIX}{symbol}", str(price), ex=PRICE_CACHE_TTL)
+                pipe.execute()
+            except redis.RedisError as e:
+                logger.warning(f"Price cache write failed: {e}")
+        
+        prices.update(fetched)
+        return prices
+    
+    def _fetch_latest_quotes(self, symbols: List[str]) -> Dict[str, Decimal]:
+        """Mid prices from the multi-symbol latest quotes endpoint."""
+        prices = {}
+        try:
+            url = f"{self.base_url}/v2/stocks/quotes/latest"
+            response = requests.get(
+                url, headers=self.headers, params={'symbols': ",".join(symbols)}, timeout=10
+            )
+            
+            if response.status_code == 200:
+                for symbol, quote in response.json().get('quotes', {}).items():
+                    bid = quote.get('bp', 0)
+                    ask = quote.get('ap', 0)
+                    if bid and ask:
+                        prices[symbol] = Decimal(str((bid + ask) / 2))
+                    elif bid or ask:
+                        prices[symbol] = Decimal(str(bid or ask))
+                        
+        except Exception as e:
+            logger.warning(f"Failed to get prices for {len(symbols)} symbols: {e}")
+        
+        return prices
+    
     def get_avg_daily_volume_usd(self, symbol: str, days: int = 20) -> float:
         """Get average daily volume in USD over past N days."""
         try:
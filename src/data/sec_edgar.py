@@ -35,11 +35,13 @@ class SECEdgarFetcher:
             time.sleep(min_delay - elapsed)
         self._last_request_time = time.time()
     
-    def fetch_recent_form4(self, limit: int = 100) -> List[Dict]:
+    def fetch_recent_form4(self, limit: int = 100, insider_trades: Optional[List[Dict]] = None) -> List[Dict]:
         """Fetch recent Form 4 (insider transaction) filings.
         
         Args:
             limit: Maximum number of filings to return
+            insider_trades: OpenInsider purchases already fetched with
+                OpenInsiderFetcher.fetch_recent_buys, used instead of fetching
             
         Returns:
             List of insider transaction dicts
@@ -50,13 +52,16 @@ class SECEdgarFetcher:
         logger.info("Fetching Form 4 filings via OpenInsider", limit=limit)
         
         try:
-            # Use OpenInsider as a reliable source for insider trades
-            from src.data.openinsider import OpenInsiderFetcher
-            
-            oi_fetcher = OpenInsiderFetcher()
-            
-            # Fetch recent insider purchases (these are Form 4 equivalent)
-            insider_trades = oi_fetcher.fetch_recent_buys(limit=limit)
+            if insider_trades is None:
+                # Use OpenInsider as a reliable source for insider trades
+                from src.data.openinsider import OpenInsiderFetcher
+                
+                oi_fetcher = OpenInsiderFetcher()
+                
+                # Fetch recent insider purchases (these are Form 4 equivalent)
+                insider_trades = oi_fetcher.fetch_recent_buys(limit=limit)
+            else:
+                insider_trades = insider_trades[:limit]
             
             # Transform to Form 4 format
             form4_filings = []
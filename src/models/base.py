@@ -2,21 +2,34 @@
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool
 from config.settings import get_settings
 
 settings = get_settings()
 
 # Create database engine
+# LIFO checkout keeps a small set of connections hot instead of cycling
+# through the whole pool; recycle before server-side idle timeouts kick in.
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
+    pool_size=20,
+    max_overflow=30,
+    pool_use_lifo=True,
+    pool_recycle=1800
 )
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+def create_script_engine():
+    """
+    Engine for one-shot scripts.
+    Uses NullPool so the process doesn't warm up a pool of idle
+    connections that are only torn down again at exit.
+    """
+    return create_engine(settings.DATABASE_URL, poolclass=NullPool)
+
 # Base class for all models
 Base = declarative_base()
 
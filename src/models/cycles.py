@@ -2,7 +2,7 @@
 Cycle model for tracking trading cycles.
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Index, text
 from datetime import datetime
 from src.models.base import Base
 
@@ -47,5 +47,14 @@ class Cycle(Base):
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        # Newest ACTIVE cycle lookup (CycleManager.get_active_cycle)
+        Index(
+            'idx_cycles_active_created',
+            created_at.desc(),
+            postgresql_where=text("status = 'ACTIVE'")
+        ),
+    )
+    
     def __repr__(self):
         return f"<Cycle(cycle_id='{self.cycle_id}', status='{self.status}', start='{self.start_date.date()}', end='{self.end_date.date()}')>"
@@ -1,5 +1,5 @@
 """Order database model."""
-from sqlalchemy import Column, String, Numeric, TIMESTAMP, Integer, Text
+from sqlalchemy import Column, String, Numeric, TIMESTAMP, Integer, Text, Index
 from sqlalchemy.sql import func
 from src.models.base import Base
 
@@ -39,3 +39,8 @@ class Order(Base):
     # Audit
     created_at = Column(TIMESTAMP, nullable=False, server_default=func.now())
     updated_at = Column(TIMESTAMP, nullable=False, server_default=func.now(), onupdate=func.now())
+    
+    __table_args__ = (
+        # Keyset pagination for newest-first listings
+        Index('idx_orders_created_order_id', created_at.desc(), order_id.desc()),
+    )
@@ -1,5 +1,5 @@
 """Position database model."""
-from sqlalchemy import Column, String, Numeric, TIMESTAMP, Integer, Boolean, ARRAY
+from sqlalchemy import Column, String, Numeric, TIMESTAMP, Integer, Boolean, ARRAY, Index
 from sqlalchemy.sql import func
 from src.models.base import Base
 
@@ -48,3 +48,12 @@ class Position(Base):
     # Timestamps
     created_at = Column(TIMESTAMP, nullable=False, server_default=func.now())
     updated_at = Column(TIMESTAMP, nullable=False, server_default=func.now(), onupdate=func.now())
+    
+    __table_args__ = (
+        # Status counts and closed-position P&L / win rate aggregates
+        Index('idx_positions_status_pnl', 'status', 'realized_pnl'),
+        # Index-only sum of deployed capital over open positions
+        Index('idx_positions_status_entry_value', 'status', postgresql_include=['entry_value']),
+        # Keyset pagination for newest-first listings
+        Index('idx_positions_entry_date_position_id', entry_date.desc(), position_id.desc()),
+    )
@@ -3,7 +3,7 @@ Scenario tracking models for parallel execution.
 Each scenario runs independently with its own positions and P&L.
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, JSON, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from src.models.base import Base
@@ -98,6 +98,11 @@ class ScenarioPosition(Base):
     
     # Relationships
     scenario = relationship("Scenario", back_populates="positions")
+    
+    __table_args__ = (
+        # Open positions per scenario
+        Index('idx_scenario_positions_scenario_status', 'scenario_id', 'status'),
+    )
 
 
 class ScenarioTrade(Base):
@@ -1,5 +1,5 @@
 """Signal database model."""
-from sqlalchemy import Column, String, Numeric, TIMESTAMP, Integer, JSON
+from sqlalchemy import Column, String, Numeric, TIMESTAMP, Integer, JSON, Index, text
 from sqlalchemy.sql import func
 from src.models.base import Base
 
@@ -55,3 +55,24 @@ class Signal(Base):
     raw_data = Column(JSON)
     created_at = Column(TIMESTAMP, nullable=False, server_default=func.now())
     updated_at = Column(TIMESTAMP, nullable=False, server_default=func.now(), onupdate=func.now())
+    
+    __table_args__ = (
+        # Partial index backing per-symbol counts over ACTIVE signals
+        Index('idx_signals_active_symbol', 'symbol', postgresql_where=text("status = 'ACTIVE'")),
+        # Per-source counts and filing-date windows within a source
+        Index('idx_signals_source_fdate', 'source', 'filing_date'),
+        # Covering index for "most recent signals" listings
+        Index(
+            'idx_signals_recent_cover',
+            filing_date.desc(),
+            postgresql_include=['source', 'symbol', 'filer_name', 'transaction_value'],
+        ),
+        # Keyset pagination for newest-first listings
+        Index('idx_signals_discovered_signal_id', discovered_at.desc(), signal_id.desc()),
+        # Ranked unallocated signals for cycle allocation (CycleAllocator._get_available_signals)
+        Index(
+            'idx_signals_active_unallocated_score',
+            total_score.desc(),
+            postgresql_where=text("status = 'ACTIVE' AND cycle_id IS NULL")
+        ),
+    )
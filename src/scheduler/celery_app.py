@@ -3,6 +3,7 @@ Celery application configuration.
 """
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init
 from config.settings import get_settings
 
 settings = get_settings()
@@ -65,5 +66,11 @@ app.conf.beat_schedule = {
     },
 }
 
+@worker_process_init.connect
+def register_cache_invalidation(**kwargs):
+    """Drop cached API stats when task commits change positions, signals or orders."""
+    from src.api.cache import register_stats_invalidation
+    register_stats_invalidation()
+
 if __name__ == '__main__':
     app.start()
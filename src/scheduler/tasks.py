@@ -9,7 +9,6 @@ from src.models.positions import Position
 from src.data.stock_act import StockActFetcher
 from src.data.transformers import SignalTransformer
 from src.core.signal_scorer import SignalScorer
-from src.core.allocator import Allocator
 from src.core.round_manager import RoundManager
 from src.core.scenario_manager import ScenarioManager
 from src.execution.paper_broker import PaperBroker
@@ -281,13 +280,7 @@ def allocate_and_execute(self):
             active_cycle = cycle_manager.create_new_cycle()
             logger.info(f"Created new cycle: {active_cycle.cycle_id}")
         
-        # Get open positions
-        open_positions = db.query(Position).filter(
-            Position.status == 'OPEN'
-        ).all()
-        
         # Initialize components
-        allocator = Allocator()
         broker = PaperBroker()
         broker.connect()
         
@@ -315,7 +308,7 @@ def allocate_and_execute(self):
         
         for decision in decisions:
             try:
-                symbol = decision['symbol']
+                symbol = decision.symbol
                 
                 # Check for existing positions in this symbol
                 existing_positions = db.query(Position).filter(
@@ -346,8 +339,8 @@ def allocate_and_execute(self):
                 # Create order using allocation format
                 allocation = {
                     'symbol': symbol,
-                    'direction': decision['direction'],
-                    'shares': decision['shares']
+                    'direction': decision.direction,
+                    'shares': decision.shares
                 }
                 
                 order = order_manager.create_entry_order(allocation, position_id)
@@ -360,12 +353,12 @@ def allocate_and_execute(self):
                     position = Position(
                         position_id=position_id,
                         symbol=symbol,
-                        direction=decision['direction'],
+                        direction=decision.direction,
                         entry_date=datetime.utcnow(),
-                        entry_price=order.filled_avg_price or decision['target_price'],
-                        shares=decision['shares'],
-                        entry_value=float(decision['shares']) * float(order.filled_avg_price or decision['target_price']),
-                        conviction_tier=decision['conviction_tier'],
+                        entry_price=order.filled_avg_price or decision.target_price,
+                        shares=decision.shares,
+                        entry_value=float(decision.shares) * float(order.filled_avg_price or decision.target_price),
+                        conviction_tier=decision.conviction_tier,
                         cycle_id=active_cycle.cycle_id,
                         status='OPEN',
                         round_start=datetime.utcnow(),
@@ -375,10 +368,10 @@ def allocate_and_execute(self):
                     db.add(position)
                     executed += 1
                     
-                    logger.info(f"Executed position: {decision['symbol']} {decision['shares']} shares @ ${order.filled_avg_price or decision['target_price']}")
+                    logger.info(f"Executed position: {decision.symbol} {decision.shares} shares @ ${order.filled_avg_price or decision.target_price}")
                 
             except Exception as e:
-                logger.error(f"Failed to execute decision for {decision['symbol']}: {e}")
+                logger.error(f"Failed to execute decision for {decision.symbol}: {e}")
                 continue
         
         # Update cycle performance
@@ -417,9 +410,9 @@ def cleanup_duplicate_positions(self):
         # Find symbols with multiple open positions
         from sqlalchemy import func
         
-        duplicate_symbols = db.query(Position.symbol, func.count(Position.position_id)).filter(
+        duplicate_symbols = db.query(Position.symbol, func.count()).filter(
             Position.status == 'OPEN'
-        ).group_by(Position.symbol).having(func.count(Position.position_id) > 1).all()
+        ).group_by(Position.symbol).having(func.count() > 1).all()
         
         logger.info(f"Found {len(duplicate_symbols)} symbols with duplicate positions")
         
@@ -0,0 +1,19 @@
+"""Shared Redis client for the response cache and short-lived data caches."""
+import redis
+from config.settings import get_settings
+
+_client = None
+
+def get_cache_client() -> redis.Redis:
+    """Lazily create the Redis client used for caching."""
+    global _client
+    if _client is None:
+        settings = get_settings()
+        _client = redis.Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=1,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5
+        )
+    return _client